@@ -0,0 +1,62 @@
+"""
+Benchmark concurrent Elements lookups with increasing numbers of threads.
+
+On free-threaded Python builds, throughput should scale with the
+number of threads. On builds with the GIL it will stay roughly flat.
+"""
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+
+from elementable import Elementable
+
+
+def run_lookups(elements, barrier, n_lookups):
+    symbols = [el.symbol for el in elements]
+    names = [el.name for el in elements]
+    numbers = list(range(elements.n_elements))
+    n_rounds = max(1, n_lookups // (3 * len(numbers)))
+    barrier.wait()
+    start = time.perf_counter()
+    for _ in range(n_rounds):
+        for symbol, name, number in zip(symbols, names, numbers):
+            elements(symbol=symbol)
+            elements(name=name)
+            elements(atomic_number=number)
+    return time.perf_counter() - start, 3 * n_rounds * len(numbers)
+
+
+def benchmark(n_threads, n_lookups, lazy):
+    # a fresh table so first-use initialization also runs concurrently
+    elements = Elementable(lazy=lazy)
+    barrier = Barrier(n_threads)
+    with ThreadPoolExecutor(max_workers=n_threads) as executor:
+        futures = [
+            executor.submit(run_lookups, elements, barrier, n_lookups)
+            for _ in range(n_threads)
+        ]
+        results = [future.result() for future in futures]
+    elapsed = max(duration for duration, _ in results)
+    total = sum(count for _, count in results)
+    return total / elapsed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--lookups", type=int, default=300000,
+                        help="Number of lookups per thread")
+    parser.add_argument("--lazy", action="store_true",
+                        help="Create elements on first access")
+    args = parser.parse_args()
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL enabled: {gil}")
+    baseline = None
+    for n_threads in args.threads:
+        rate = benchmark(n_threads, args.lookups, args.lazy)
+        baseline = baseline or rate
+        print(f"{n_threads:>3} threads: {rate:>12,.0f} lookups/s "
+              f"({rate / baseline:.2f}x)")
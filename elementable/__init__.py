@@ -2,6 +2,8 @@
 
 # Add imports here
 from .elementable import *
+from .compact import *
+from .hooks import *
 
 # Handle versioneer
 from ._version import get_versions
@@ -0,0 +1,217 @@
+"""
+NumPy helpers for working with element attributes as arrays, indexed by row.
+"""
+
+from typing import Callable, Union
+
+import numpy as np
+
+from .exceptions import ElementableError
+
+__all__ = [
+    "column_array",
+    "pairwise_array",
+    "dense_row_table",
+    "gather_rows",
+    "sorted_row_table",
+    "search_rows",
+    "PAIRWISE_OPERATIONS",
+]
+
+
+PAIRWISE_OPERATIONS = {
+    "sum": np.add,
+    "difference": np.subtract,
+    "product": np.multiply,
+    "min": np.fmin,
+    "max": np.fmax,
+    "mean": lambda a, b: (a + b) / 2,
+    "geometric": lambda a, b: np.sqrt(a * b),
+}
+
+
+def column_array(elements, attr_name: str) -> np.ndarray:
+    """Return a numeric attribute of every element as a float array.
+
+    Missing values (e.g. ``None``) are NaN.
+    Values are bare magnitudes in the units of the elements.
+    The array is read-only.
+
+    Parameters
+    ----------
+        elements: Elements
+            The element container
+        attr_name: str
+            The attribute, e.g. "mass"
+
+    Returns
+    -------
+        values: numpy.ndarray
+            An array of shape ``(n_elements,)``
+    """
+    column = elements.column(attr_name)
+    try:
+        values = np.array(
+            [np.nan if value is None else value for value in column],
+            dtype=float,
+        )
+    except (TypeError, ValueError):
+        raise ElementableError(f"{attr_name} is not a numeric attribute")
+    values.setflags(write=False)
+    return values
+
+
+def pairwise_array(
+    values: np.ndarray,
+    op: Union[str, Callable] = "sum",
+    tolerance: float = 0.0,
+) -> np.ndarray:
+    """Combine every pair of values into a matrix.
+
+    Parameters
+    ----------
+        values: numpy.ndarray
+            An array of shape ``(n,)``
+        op: str or Callable
+            How to combine each pair. One of "sum", "difference", "product",
+            "min", "max", "mean" or "geometric"; or a function that
+            takes two broadcastable arrays.
+        tolerance: float
+            A value added to each combined pair
+
+    Returns
+    -------
+        matrix: numpy.ndarray
+            An array of shape ``(n, n)``. NaN values propagate.
+    """
+    if isinstance(op, str):
+        try:
+            op = PAIRWISE_OPERATIONS[op]
+        except KeyError:
+            raise ElementableError(
+                f"Unknown pairwise operation {op}. Available: "
+                + ", ".join(sorted(PAIRWISE_OPERATIONS))
+            ) from None
+    matrix = np.asarray(op(values[:, np.newaxis], values[np.newaxis, :]), dtype=float)
+    if tolerance:
+        matrix = matrix + tolerance
+    return matrix
+
+
+def dense_row_table(values_by_key: tuple) -> np.ndarray:
+    """Convert the values of a dense row registry to an array of rows.
+
+    Keys without an element have a row of -1.
+    The array is read-only.
+
+    Parameters
+    ----------
+        values_by_key: tuple
+            The row of each key, by position, or a sentinel
+            for missing keys (see :attr:`DenseMapping.values_by_key`)
+
+    Returns
+    -------
+        table: numpy.ndarray
+    """
+    if any(isinstance(row, tuple) for row in values_by_key):
+        raise ElementableError("Keys do not have unique rows")
+    table = np.array(
+        [row if isinstance(row, int) else -1 for row in values_by_key],
+        dtype=np.intp,
+    )
+    table.setflags(write=False)
+    return table
+
+
+def gather_rows(table: np.ndarray, keys) -> np.ndarray:
+    """Look up the row of each integer key in a dense row table.
+
+    Keys that are negative, not integral or not in the table
+    have a row of -1.
+
+    Parameters
+    ----------
+        table: numpy.ndarray
+            The row of each key, from :func:`dense_row_table`
+        keys: numpy.ndarray
+            The keys to look up
+
+    Returns
+    -------
+        rows: numpy.ndarray
+            An array of the same shape as ``keys``
+    """
+    keys = np.asarray(keys)
+    if keys.dtype.kind == "f":
+        with np.errstate(invalid="ignore"):
+            positions = np.where(np.isfinite(keys), keys, -1).astype(np.int64)
+        positions[positions != keys] = -1
+    else:
+        positions = keys.astype(np.int64)
+    valid = (positions >= 0) & (positions < len(table))
+    rows = np.full(keys.shape, -1, dtype=np.intp)
+    rows[valid] = table[positions[valid]]
+    return rows
+
+
+def sorted_row_table(row_registry) -> tuple:
+    """Convert a row registry with integer keys to sorted arrays.
+
+    Parameters
+    ----------
+        row_registry: Mapping[int, int]
+            The row of each key
+
+    Returns
+    -------
+        keys: numpy.ndarray
+            The sorted keys
+        rows: numpy.ndarray
+            The row of each key
+    """
+    if any(isinstance(row, tuple) for row in row_registry.values()):
+        raise ElementableError("Keys do not have unique rows")
+    keys = np.array(sorted(row_registry), dtype=np.int64)
+    rows = np.array([row_registry[key] for key in keys.tolist()], dtype=np.intp)
+    keys.setflags(write=False)
+    rows.setflags(write=False)
+    return keys, rows
+
+
+def search_rows(sorted_keys: np.ndarray, rows: np.ndarray, keys) -> np.ndarray:
+    """Look up the row of each integer key with a binary search.
+
+    Keys that are not integral or not found have a row of -1.
+
+    Parameters
+    ----------
+        sorted_keys: numpy.ndarray
+            The sorted keys, from :func:`sorted_row_table`
+        rows: numpy.ndarray
+            The row of each key, from :func:`sorted_row_table`
+        keys: numpy.ndarray
+            The keys to look up
+
+    Returns
+    -------
+        rows: numpy.ndarray
+            An array of the same shape as ``keys``
+    """
+    keys = np.asarray(keys)
+    valid = np.ones(keys.shape, dtype=bool)
+    if keys.dtype.kind == "f":
+        valid = np.isfinite(keys)
+        with np.errstate(invalid="ignore"):
+            integers = np.where(valid, keys, 0).astype(np.int64)
+        valid &= integers == keys
+        keys = integers
+    keys = keys.astype(np.int64)
+    found = np.full(keys.shape, -1, dtype=np.intp)
+    if not len(sorted_keys):
+        return found
+    positions = np.searchsorted(sorted_keys, keys)
+    positions = np.minimum(positions, len(sorted_keys) - 1)
+    valid &= sorted_keys[positions] == keys
+    found[valid] = rows[positions[valid]]
+    return found
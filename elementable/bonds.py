@@ -0,0 +1,200 @@
+"""
+Bond perception from covalent radii with a cell-list neighbor search.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import itertools
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+from .arrays import column_array
+from .exceptions import ElementableError
+
+__all__ = ["perceive_bonds"]
+
+
+def _cell_keys(cells: np.ndarray) -> np.ndarray:
+    """View each row of integer cell indices as a single sortable value"""
+    cells = np.ascontiguousarray(cells, dtype=np.int64)
+    return cells.view(np.dtype((np.void, cells.dtype.itemsize * 3))).ravel()
+
+
+def perceive_bonds(
+    elements,
+    element_rows,
+    coordinates,
+    box=None,
+    tolerance: float = 0.45,
+    min_distance: float = 0.1,
+    attr_name: str = "covalent_radius",
+    chunk_size: int = 65536,
+    max_workers: Optional[int] = None,
+    return_distances: bool = False,
+) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+    """Find bonds between atoms that are within the sum of their covalent radii.
+
+    Two atoms are bonded if ``min_distance < d <= r_i + r_j + tolerance``.
+    Atoms are binned into a grid of cells at least as wide as the
+    largest cutoff, so only atoms in neighboring cells are compared.
+    Atoms are processed in chunks, which are spread over a thread pool.
+    Atoms with a missing radius are never bonded.
+
+    Parameters
+    ----------
+        elements: Elements
+            The element container
+        element_rows: numpy.ndarray
+            The row of the element of each atom, shape ``(n_atoms,)``
+        coordinates: numpy.ndarray
+            The coordinates of each atom, shape ``(n_atoms, 3)``,
+            in the same units as the radii
+        box: numpy.ndarray
+            The lengths of an orthorhombic periodic box, shape ``(3,)``.
+            If given, distances follow the minimum image convention.
+        tolerance: float
+            A value added to the sum of the radii
+        min_distance: float
+            Atoms closer than this are not bonded
+        attr_name: str
+            The attribute with the radii
+        chunk_size: int
+            The number of atoms in each chunk
+        max_workers: int
+            The maximum number of threads to use.
+            With 1, chunks are processed in the calling thread.
+        return_distances: bool
+            Whether to also return the length of each bond
+
+    Returns
+    -------
+        bonds: numpy.ndarray
+            The atom indices of each bond, shape ``(n_bonds, 2)``,
+            with the lower index first and sorted by index
+        distances: numpy.ndarray
+            The length of each bond, shape ``(n_bonds,)``.
+            Only returned if ``return_distances`` is True.
+    """
+    rows = np.asarray(element_rows, dtype=np.intp)
+    coordinates = np.asarray(coordinates, dtype=float)
+    n_atoms = len(rows)
+    if rows.ndim != 1 or coordinates.shape != (n_atoms, 3):
+        raise ElementableError(
+            "element_rows must have shape (n_atoms,) and "
+            "coordinates must have shape (n_atoms, 3)"
+        )
+    if n_atoms and (rows.min() < 0 or rows.max() >= elements.n_elements):
+        raise ElementableError("element_rows must be rows of the elements")
+
+    cutoffs = elements.pairwise(attr_name, op="sum", tolerance=tolerance)
+    radii = column_array(elements, attr_name)[rows]
+    bonds = np.empty((0, 2), dtype=np.intp)
+    distances = np.empty(0, dtype=float)
+    if np.isnan(radii).all():
+        return (bonds, distances) if return_distances else bonds
+    max_cutoff = 2 * np.nanmax(radii) + tolerance
+
+    if box is not None:
+        box = np.asarray(box, dtype=float)
+        if box.shape != (3,):
+            raise ElementableError(
+                "box must be the three lengths of an orthorhombic box"
+            )
+        if max_cutoff * 2 > box.min():
+            raise ElementableError(
+                f"The largest cutoff ({max_cutoff}) must be less than "
+                "half the shortest box length"
+            )
+        coordinates = coordinates % box
+        n_cells = np.maximum((box // max_cutoff).astype(np.int64), 1)
+        cell_size = box / n_cells
+        cells = np.minimum((coordinates // cell_size).astype(np.int64), n_cells - 1)
+    else:
+        origin = coordinates.min(axis=0) if n_atoms else np.zeros(3)
+        cells = ((coordinates - origin) // max_cutoff).astype(np.int64)
+        n_cells = cells.max(axis=0) + 1 if n_atoms else np.ones(3, dtype=np.int64)
+
+    # with fewer than 3 cells along a periodic axis, the
+    # neighbors on either side are the same cell
+    axis_offsets = [
+        (0,) if box is not None and n == 1
+        else (0, 1) if box is not None and n == 2
+        else (-1, 0, 1)
+        for n in n_cells
+    ]
+    offsets = np.array(list(itertools.product(*axis_offsets)), dtype=np.int64)
+
+    n_total_cells = 1
+    for n in n_cells:
+        n_total_cells *= int(n)
+    if n_total_cells <= max(8 * n_atoms, 1 << 16):
+        # a dense grid of cells is much faster than searching
+        cell_ids = np.ravel_multi_index(cells.T, n_cells)
+
+        def find_cells(neighbors):
+            if box is not None:
+                valid = np.ones(len(neighbors), dtype=bool)
+            else:
+                valid = ((neighbors >= 0) & (neighbors < n_cells)).all(axis=1)
+            return valid, np.ravel_multi_index(neighbors[valid].T, n_cells)
+    else:
+        # sparse grids, e.g. from distant molecules without a box, would
+        # overflow when flattened, so only the occupied cells are numbered
+        occupied, cell_ids = np.unique(_cell_keys(cells), return_inverse=True)
+        cell_ids = cell_ids.ravel()
+        n_total_cells = len(occupied)
+
+        def find_cells(neighbors):
+            keys = _cell_keys(neighbors)
+            ids = np.minimum(np.searchsorted(occupied, keys), n_total_cells - 1)
+            valid = occupied[ids] == keys
+            return valid, ids[valid]
+
+    order = np.argsort(cell_ids, kind="stable")
+    cell_counts = np.bincount(cell_ids, minlength=n_total_cells)
+    cell_starts = np.cumsum(cell_counts) - cell_counts
+
+    def search(atoms):
+        atom_cells = cells[atoms]
+        chunk_i, chunk_j = [], []
+        for offset in offsets:
+            neighbors = atom_cells + offset
+            if box is not None:
+                neighbors %= n_cells
+            valid, neighbor_ids = find_cells(neighbors)
+            start = cell_starts[neighbor_ids]
+            count = cell_counts[neighbor_ids]
+            i = np.repeat(atoms[valid], count)
+            positions = np.repeat(start - np.cumsum(count) + count, count)
+            j = order[positions + np.arange(len(positions))]
+            keep = i < j
+            chunk_i.append(i[keep])
+            chunk_j.append(j[keep])
+        i = np.concatenate(chunk_i)
+        j = np.concatenate(chunk_j)
+
+        vectors = coordinates[j] - coordinates[i]
+        if box is not None:
+            vectors -= box * np.round(vectors / box)
+        lengths = np.sqrt(np.einsum("ij,ij->i", vectors, vectors))
+        bonded = (lengths > min_distance) & (lengths <= cutoffs[rows[i], rows[j]])
+        return i[bonded], j[bonded], lengths[bonded]
+
+    chunks = [
+        np.arange(start, min(start + chunk_size, n_atoms))
+        for start in range(0, n_atoms, chunk_size)
+    ]
+    if max_workers == 1 or len(chunks) <= 1:
+        results = [search(chunk) for chunk in chunks]
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(search, chunks))
+
+    if results:
+        i = np.concatenate([result[0] for result in results])
+        j = np.concatenate([result[1] for result in results])
+        lengths = np.concatenate([result[2] for result in results])
+        sort = np.lexsort((j, i))
+        bonds = np.stack([i[sort], j[sort]], axis=1)
+        distances = lengths[sort]
+    return (bonds, distances) if return_distances else bonds
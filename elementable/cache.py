@@ -0,0 +1,139 @@
+from collections import OrderedDict
+from functools import lru_cache
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+__all__ = ["NormalizationCache", "LRUCache"]
+
+_MISSING = object()
+
+
+class NormalizationCache:
+    """A bounded LRU cache of raw query values to the elements they resolve to.
+
+    Normalization (converters, unit conversion and rounding) and the
+    registry lookup are skipped for values that were queried recently.
+    Values of different types are cached separately, as converters
+    may treat them differently (e.g. ``1`` and ``1.0``).
+    Unhashable values, such as some unit quantities, bypass the cache.
+    Values that do not match an element are not cached.
+
+    Parameters
+    ----------
+        lookup: Callable
+            Returns the element(s) for a raw value
+        maxsize: int
+            The largest number of values to keep
+    """
+
+    def __init__(self, lookup: Callable, maxsize: int):
+        self.maxsize = maxsize
+        self._lookup = lookup
+        self._bypasses = 0
+        self._failures = 0
+
+        def counted_lookup(value):
+            try:
+                return lookup(value)
+            except Exception:
+                self._failures += 1
+                raise
+
+        self._cached_lookup = lru_cache(maxsize=maxsize, typed=True)(
+            counted_lookup
+        )
+
+    def __call__(self, value) -> Any:
+        try:
+            return self._cached_lookup(value)
+        except TypeError:
+            try:
+                hash(value)
+            except TypeError:
+                self._bypasses += 1
+                return self._lookup(value)
+            raise
+
+    def clear(self):
+        """Forget all cached values and reset the statistics"""
+        self._cached_lookup.cache_clear()
+        self._bypasses = 0
+        self._failures = 0
+
+    def info(self) -> Dict[str, Any]:
+        """Return the size and statistics of the cache.
+
+        Evictions are the values dropped to make room for newer ones,
+        and bypasses the unhashable values that were not cached.
+        """
+        info = self._cached_lookup.cache_info()
+        lookups = info.hits + info.misses
+        return {
+            "maxsize": self.maxsize,
+            "size": info.currsize,
+            "hits": info.hits,
+            "misses": info.misses,
+            "hit_rate": info.hits / lookups if lookups else 0.0,
+            "evictions": max(info.misses - self._failures - info.currsize, 0),
+            "bypasses": self._bypasses,
+        }
+
+
+class LRUCache:
+    """A thread-safe mapping that keeps the most recently used items.
+
+    Parameters
+    ----------
+        maxsize: int
+            The largest number of items to keep
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable, default=None) -> Any:
+        """Return the item for ``key`` and mark it as recently used"""
+        with self._lock:
+            value = self._items.get(key, _MISSING)
+            if value is _MISSING:
+                self._misses += 1
+                return default
+            self._hits += 1
+            self._items.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any):
+        """Add an item, dropping the least recently used item if full"""
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self):
+        """Forget all items and reset the statistics"""
+        with self._lock:
+            self._items.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def info(self) -> Dict[str, Any]:
+        """Return the size and statistics of the cache"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "maxsize": self.maxsize,
+                "size": len(self._items),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "evictions": self._evictions,
+            }
@@ -0,0 +1,97 @@
+import json
+from typing import Any, Dict
+
+__all__ = ["CompactElement"]
+
+
+class CompactElementMeta(type):
+    """Metaclass that turns annotations into ``__slots__``"""
+
+    def __new__(mcls, name, bases, namespace, **kwargs):
+        inherited = set()
+        for base in bases:
+            inherited.update(getattr(base, "_fields", ()))
+        annotations = namespace.get("__annotations__", {})
+        own_fields = tuple(k for k in annotations if k not in inherited)
+        namespace["__slots__"] = tuple(namespace.get("__slots__", ())) + own_fields
+        cls = super().__new__(mcls, name, bases, namespace, **kwargs)
+        base_slots = tuple(
+            slot
+            for base in bases
+            for slot in getattr(base, "_slots", ())
+        )
+        # keep the slot descriptors in case a field is later
+        # overridden on the class, e.g. to attach units on access
+        cls._slots = base_slots + tuple(
+            (field, cls.__dict__[field]) for field in own_fields
+        )
+        cls._fields = tuple(field for field, _ in cls._slots)
+        return cls
+
+
+class CompactElement(metaclass=CompactElementMeta):
+    """A memory-efficient, immutable base class for elements.
+
+    Attributes are stored in ``__slots__`` generated from the annotations,
+    so instances do not carry a per-instance ``__dict__``.
+    This makes it a light-weight alternative to a Pydantic BaseModel
+    when a NamedTuple is not desired, e.g. because elements should
+    not behave as sequences.
+
+    Examples
+    --------
+    ::
+
+        elements = Elementable(element_cls=CompactElement)
+        h = elements(atomic_number=1)
+        h.dict()
+        h.json()
+    """
+
+    __slots__ = ("__weakref__",)
+
+    def __init__(self, **kwargs):
+        for field, slot in self._slots:
+            slot.__set__(self, kwargs.get(field))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __getstate__(self):
+        return self.dict()
+
+    def __setstate__(self, state):
+        for field, slot in self._slots:
+            slot.__set__(self, state.get(field))
+
+    def _values(self):
+        return tuple(slot.__get__(self) for _, slot in self._slots)
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._values() == other._values()
+
+    def __hash__(self):
+        return hash(self._values())
+
+    def __repr__(self):
+        values = ", ".join(
+            f"{field}={value!r}"
+            for field, value in zip(self._fields, self._values())
+        )
+        return f"{type(self).__name__}({values})"
+
+    def dict(self) -> Dict[str, Any]:
+        """Return the stored attributes as a dictionary"""
+        return dict(zip(self._fields, self._values()))
+
+    def json(self, **kwargs) -> str:
+        """Return the stored attributes as a JSON string.
+
+        Keyword arguments are passed to :func:`json.dumps`.
+        """
+        return json.dumps(self.dict(), **kwargs)
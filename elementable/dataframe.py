@@ -0,0 +1,414 @@
+"""
+Optional pandas integration.
+
+Importing this module registers an ``elements`` accessor on pandas Series,
+which maps a column of symbols or atomic numbers to element attributes
+with vectorized lookups::
+
+    import elementable.dataframe
+
+    symbols = pd.Series(["C", "H", "H", "o"])
+    symbols.elements.mass
+    symbols.elements(CustomElements, attr_name="name").color
+
+It also registers an "element" dtype, which stores each element as
+a small integer code (the row of the element) instead of an object::
+
+    atoms = pd.Series(["C", "H", "H", "o"], dtype="element")
+    atoms.elements.mass
+"""
+
+import numbers
+
+import numpy as np
+import pandas as pd
+from pandas.api.extensions import (
+    ExtensionArray,
+    ExtensionDtype,
+    register_extension_dtype,
+    take,
+)
+
+from .elementable import Elements as DefaultElements
+from .exceptions import InvalidElementError
+
+__all__ = [
+    "elements_to_frame",
+    "element_rows",
+    "ElementsAccessor",
+    "ElementDtype",
+    "ElementArray",
+]
+
+
+def elements_to_frame(elements) -> pd.DataFrame:
+    """Create a DataFrame of all attributes of all elements.
+
+    Rows are in the same order as the elements in the container.
+
+    Parameters
+    ----------
+        elements: Elements
+            The element container
+
+    Returns
+    -------
+        frame: pandas.DataFrame
+    """
+    attributes = list(elements.element_class.__annotations__)
+    return pd.DataFrame(
+        {attr_name: elements.column(attr_name) for attr_name in attributes},
+        index=pd.RangeIndex(elements.n_elements, name="row"),
+        columns=attributes,
+    )
+
+
+def element_rows(elements, values, attr_name=None) -> np.ndarray:
+    """Return the row of the element for each value.
+
+    Values can be elements, or values of ``attr_name``.
+    Missing values have a row of -1.
+
+    Parameters
+    ----------
+        elements: Elements
+            The element container
+        values: Iterable
+            The values to search
+        attr_name: str
+            The attribute to search. By default, integer values are
+            searched by ``atomic_number`` (if available) and
+            others by the ``key_attr`` of the elements.
+
+    Returns
+    -------
+        rows: numpy.ndarray
+
+    Raises
+    ------
+        InvalidElementError
+            If a value that is not missing does not match an element
+    """
+    values = list(values)
+    present = [value for value in values if not _is_missing(value)]
+    if attr_name is None:
+        attr_name = elements.key_attr
+        if (
+            present
+            and isinstance(present[0], numbers.Integral)
+            and not isinstance(present[0], bool)
+            and "atomic_number" in elements.registry._fields
+        ):
+            attr_name = "atomic_number"
+
+    element_class = elements.element_class
+    keys = [
+        getattr(value, attr_name) if isinstance(value, element_class)
+        else None if _is_missing(value)
+        else value
+        for value in values
+    ]
+    rows = np.array(elements.rows(attr_name, keys), dtype=np.intp)
+    invalid = [
+        value for value, row in zip(values, rows)
+        if row == -1 and not _is_missing(value)
+    ]
+    if invalid:
+        raise InvalidElementError(f"{attr_name}={invalid[0]!r}")
+    return rows
+
+
+def _is_missing(value) -> bool:
+    return pd.api.types.is_scalar(value) and pd.isna(value)
+
+
+@register_extension_dtype
+class ElementDtype(ExtensionDtype):
+    """A pandas dtype for elements of a particular element container.
+
+    Values are stored as the smallest unsigned integer code
+    that can hold the row of each element, e.g. uint8 for the
+    standard elements.
+
+    Parameters
+    ----------
+        elements: Elements
+            The element container. Defaults to the standard ``Elements``.
+    """
+
+    name = "element"
+    kind = "O"
+    na_value = pd.NA
+
+    def __init__(self, elements=None):
+        self.elements = elements if elements is not None else DefaultElements
+
+    @property
+    def type(self):
+        return self.elements.element_class
+
+    @property
+    def code_dtype(self) -> np.dtype:
+        """The integer dtype of the stored codes"""
+        for dtype in (np.uint8, np.uint16, np.uint32):
+            if self.elements.n_elements < np.iinfo(dtype).max:
+                return np.dtype(dtype)
+        return np.dtype(np.uint64)
+
+    @property
+    def na_code(self) -> int:
+        """The code used for missing values"""
+        return np.iinfo(self.code_dtype).max
+
+    @classmethod
+    def construct_array_type(cls):
+        return ElementArray
+
+    @classmethod
+    def construct_from_string(cls, string):
+        if not isinstance(string, str):
+            raise TypeError(f"Expected a string, got {type(string)}")
+        if string == cls.name:
+            return cls()
+        raise TypeError(f"Cannot construct an ElementDtype from {string!r}")
+
+    def __eq__(self, other):
+        if isinstance(other, str):
+            return other == self.name
+        return (
+            isinstance(other, ElementDtype)
+            and other.elements is self.elements
+        )
+
+    def __hash__(self):
+        return hash((type(self), id(self.elements)))
+
+    def __repr__(self):
+        return self.name
+
+
+class ElementArray(ExtensionArray):
+    """A pandas array of elements, stored as integer codes.
+
+    Parameters
+    ----------
+        codes: numpy.ndarray
+            The row of each element, with ``dtype.na_code`` for missing values.
+        dtype: ElementDtype
+            The dtype of the array.
+    """
+
+    def __init__(self, codes, dtype: ElementDtype):
+        self._dtype = dtype
+        self._codes = np.asarray(codes, dtype=dtype.code_dtype)
+
+    @classmethod
+    def from_rows(cls, rows, dtype: ElementDtype = None):
+        """Create an array from element rows, with -1 for missing values"""
+        dtype = dtype if dtype is not None else ElementDtype()
+        rows = np.asarray(rows, dtype=np.intp)
+        codes = np.where(rows < 0, dtype.na_code, rows)
+        return cls(codes, dtype)
+
+    @classmethod
+    def from_values(cls, values, elements=None, attr_name=None):
+        """Create an array from elements or element attribute values.
+
+        See :func:`element_rows` for the supported values.
+        """
+        dtype = ElementDtype(elements)
+        return cls.from_rows(
+            element_rows(dtype.elements, values, attr_name),
+            dtype,
+        )
+
+    @classmethod
+    def _from_sequence(cls, scalars, *, dtype=None, copy=False):
+        if isinstance(dtype, str):
+            dtype = ElementDtype.construct_from_string(dtype)
+        if isinstance(scalars, cls) and (dtype is None or dtype == scalars.dtype):
+            return scalars.copy() if copy else scalars
+        elements = dtype.elements if dtype is not None else None
+        return cls.from_values(scalars, elements)
+
+    @classmethod
+    def _from_factorized(cls, values, original):
+        return cls.from_rows(values, original.dtype)
+
+    def _values_for_factorize(self):
+        return self.rows, -1
+
+    def _values_for_argsort(self):
+        # elements have no ordering, so sort by row
+        return self.rows
+
+    @classmethod
+    def _concat_same_type(cls, to_concat):
+        dtype = to_concat[0].dtype
+        return cls(np.concatenate([array._codes for array in to_concat]), dtype)
+
+    @property
+    def dtype(self) -> ElementDtype:
+        return self._dtype
+
+    @property
+    def nbytes(self) -> int:
+        return self._codes.nbytes
+
+    @property
+    def codes(self) -> np.ndarray:
+        """The stored integer codes"""
+        return self._codes
+
+    @property
+    def rows(self) -> np.ndarray:
+        """The row of each element, or -1 for missing values"""
+        rows = self._codes.astype(np.intp)
+        rows[self._codes == self._dtype.na_code] = -1
+        return rows
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def __getitem__(self, item):
+        if isinstance(item, numbers.Integral):
+            code = self._codes[item]
+            if code == self._dtype.na_code:
+                return self._dtype.na_value
+            return self._dtype.elements[code]
+        item = pd.api.indexers.check_array_indexer(self, item)
+        return type(self)(self._codes[item], self._dtype)
+
+    def __setitem__(self, key, value):
+        if isinstance(value, ElementArray):
+            rows = value.rows
+        elif pd.api.types.is_list_like(value) and not isinstance(
+            value, self._dtype.type
+        ):
+            rows = element_rows(self._dtype.elements, value)
+        else:
+            rows = element_rows(self._dtype.elements, [value])[0]
+        if not isinstance(key, numbers.Integral):
+            key = pd.api.indexers.check_array_indexer(self, key)
+        self._codes[key] = np.where(np.asarray(rows) < 0, self._dtype.na_code, rows)
+
+    def __eq__(self, other):
+        if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
+            return NotImplemented
+        if isinstance(other, ElementArray):
+            rows = other.rows
+        elif pd.api.types.is_list_like(other) and not isinstance(
+            other, self._dtype.type
+        ):
+            rows = element_rows(self._dtype.elements, other)
+        else:
+            rows = element_rows(self._dtype.elements, [other])[0]
+        return (self.rows == rows) & ~self.isna()
+
+    def __array__(self, dtype=None, copy=None):
+        values = np.empty(len(self), dtype=object)
+        for i, row in enumerate(self.rows):
+            values[i] = self._dtype.elements[row] if row >= 0 else None
+        if dtype is not None and np.dtype(dtype) != object:
+            return values.astype(dtype)
+        return values
+
+    def isna(self) -> np.ndarray:
+        return self._codes == self._dtype.na_code
+
+    def take(self, indices, allow_fill=False, fill_value=None):
+        if allow_fill:
+            if fill_value is None or _is_missing(fill_value):
+                fill_value = self._dtype.na_code
+            else:
+                fill_value = element_rows(self._dtype.elements, [fill_value])[0]
+        codes = take(
+            self._codes,
+            indices,
+            allow_fill=allow_fill,
+            fill_value=fill_value,
+        )
+        return type(self)(codes, self._dtype)
+
+    def copy(self):
+        return type(self)(self._codes.copy(), self._dtype)
+
+    def attribute(self, attr_name: str) -> np.ndarray:
+        """Gather an attribute for each element.
+
+        Values are bare magnitudes in the units of the elements.
+        Missing elements give missing values.
+        """
+        column = self._dtype.elements._attribute_values(attr_name)
+        return take(column, self.rows, allow_fill=True)
+
+
+@pd.api.extensions.register_series_accessor("elements")
+class ElementsAccessor:
+    """Look up element attributes for each value of a Series.
+
+    Each distinct value is only searched once, and attributes
+    are then gathered by row from read-only arrays of the same values
+    as :meth:`Elements.to_frame`.
+    Values that do not match an element give missing values.
+
+    By default, integer Series, and float Series whose values are
+    all integral or missing, are searched by ``atomic_number``
+    and others by the ``key_attr`` of the elements (e.g. "symbol").
+    Series with an :class:`ElementDtype` are not searched at all.
+    Call the accessor to choose different elements or attribute,
+    e.g. ``series.elements(elements, attr_name="name")``.
+    """
+
+    def __init__(self, series: pd.Series, elements=None, attr_name=None):
+        self._series = series
+        if elements is None and isinstance(series.dtype, ElementDtype):
+            elements = series.dtype.elements
+        self._elements = elements if elements is not None else DefaultElements
+        self._attr_name = attr_name
+
+    def __call__(self, elements=None, attr_name=None):
+        return type(self)(
+            self._series,
+            elements if elements is not None else self._elements,
+            attr_name if attr_name is not None else self._attr_name,
+        )
+
+    @property
+    def attr_name(self) -> str:
+        """The attribute that the values are searched by"""
+        if self._attr_name is not None:
+            return self._attr_name
+        if "atomic_number" in self._elements.registry._fields:
+            if pd.api.types.is_integer_dtype(self._series):
+                return "atomic_number"
+            # integer columns with missing values are stored as floats
+            if pd.api.types.is_float_dtype(self._series):
+                values = self._series.dropna().to_numpy()
+                if np.array_equal(values, np.round(values)):
+                    return "atomic_number"
+        return self._elements.key_attr
+
+    @property
+    def rows(self) -> np.ndarray:
+        """The row of the element for each value, or -1 if not found"""
+        if (
+            isinstance(self._series.dtype, ElementDtype)
+            and self._series.dtype.elements is self._elements
+        ):
+            return self._series.array.rows
+        codes, uniques = pd.factorize(self._series)
+        unique_rows = self._elements.rows_array(self.attr_name, np.asarray(uniques))
+        return np.append(unique_rows, -1)[codes]
+
+    def __getattr__(self, name: str) -> pd.Series:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if name not in self._elements.registry._fields:
+            raise AttributeError(f"Elements have no attribute {name}")
+        values = pd.api.extensions.take(
+            self._elements._attribute_values(name),
+            self.rows,
+            allow_fill=True,
+        )
+        return pd.Series(values, index=self._series.index, name=name)
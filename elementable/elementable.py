@@ -1,16 +1,31 @@
-from typing import Type, Dict, Any, NamedTuple, Optional, Callable
+from typing import Type, Dict, Any, NamedTuple, Optional, Callable, Union, List
+import typing
 from types import MappingProxyType, new_class
 from pkg_resources import resource_filename
 from collections import namedtuple, defaultdict
+from collections.abc import Mapping
+from weakref import WeakKeyDictionary, WeakValueDictionary
+from concurrent.futures import ThreadPoolExecutor
+import functools
 import json
+import numbers
+import os
+import threading
+from time import perf_counter
 
+from .cache import LRUCache, NormalizationCache
 from .exceptions import InvalidElementError, ElementableError
+from .search import StringIndex
+from .stats import LookupStats
+from . import hooks
 
 __all__ = ["Elementable", "Elements"]
 
 
 NoneType = type(None)
 
+DEFAULT_JSON_FILE = resource_filename(__name__, "data/elements.json")
+
 
 def _resolve_multiple_types(type1, type2):
     if type1 == type2:
@@ -32,6 +47,245 @@ def _resolve_multiple_types(type1, type2):
         return float
 
 
+def _load_json(json_file: Optional[str] = None):
+    if json_file is None:
+        json_file = DEFAULT_JSON_FILE
+    with open(str(json_file), "r") as f:
+        return json.load(f)
+
+
+def _strip_optional(type_):
+    if typing.get_origin(type_) is Union:
+        args = [arg for arg in typing.get_args(type_) if arg is not NoneType]
+        if len(args) == 1:
+            return args[0]
+    return type_
+
+
+def _validate_schema(contents, schema):
+    """Check every value in ``contents`` against ``schema``, column by column"""
+    present = set().union(*map(dict.keys, contents))
+    undeclared = present - set(schema)
+    if undeclared:
+        raise ElementableError(
+            "Attributes not declared in schema: "
+            + ", ".join(sorted(undeclared))
+        )
+
+    for attr_name, attr_type in schema.items():
+        base_type = _strip_optional(attr_type)
+        allowed = {base_type}
+        if base_type is float:
+            allowed.add(int)
+        if base_type is not attr_type:
+            allowed.add(NoneType)
+
+        # missing values are None, so are only valid for Optional types
+        column = [
+            element_dictionary.get(attr_name)
+            for element_dictionary in contents
+        ]
+        invalid = [value for value in column if type(value) not in allowed]
+        if invalid:
+            raise ElementableError(
+                f"Invalid values for {attr_name} with type {attr_type}: "
+                + ", ".join(map(repr, invalid[:5]))
+            )
+
+
+class Registry:
+    """Read-only registries of elements, keyed by the value of each attribute.
+
+    Each registry is a read-only mapping that is only built
+    the first time that it is accessed, e.g. ``registry.mass``.
+    Building is guarded by a lock, so each registry is built
+    exactly once even if first accessed from several threads.
+
+    Parameters
+    ----------
+        builders: Dict[str, Callable]
+            A dictionary of functions that create a registry.
+            A key is an attribute (e.g. "mass").
+            A value is called with the attribute name to create the registry.
+    """
+
+    def __init__(self, builders: Dict[str, Callable]):
+        object.__setattr__(self, "_builders", builders)
+        object.__setattr__(self, "_fields", tuple(builders))
+        object.__setattr__(self, "_lock", threading.Lock())
+
+    def __getattr__(self, name):
+        try:
+            builder = self._builders[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        with self._lock:
+            try:
+                return self.__dict__[name]
+            except KeyError:
+                pass
+            registry = builder(name)
+            self.__dict__[name] = registry
+        return registry
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Registry is read-only")
+
+    def __iter__(self):
+        for name in self._fields:
+            yield getattr(self, name)
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __repr__(self):
+        return f"Registry({', '.join(self._fields)})"
+
+
+def _read_only(self, *args):
+    raise AttributeError(f"{type(self).__name__} is immutable")
+
+
+def _deferred_unit_getter(element_class, attr_name, unit):
+    descriptor = element_class.__dict__.get(attr_name)
+    if hasattr(descriptor, "__get__"):
+        get_magnitude = descriptor.__get__
+    else:
+        def get_magnitude(element):
+            return element.__dict__[attr_name]
+
+    quantities = {}
+
+    def getter(element):
+        magnitude = get_magnitude(element)
+        if magnitude is None:
+            return None
+        try:
+            return quantities[magnitude]
+        except KeyError:
+            return quantities.setdefault(magnitude, magnitude * unit)
+
+    return getter
+
+
+_MISSING = object()
+
+
+def _is_dense(keys) -> bool:
+    """Whether keys are small non-negative integers without large gaps"""
+    return bool(keys) and all(
+        type(key) is int and key >= 0 for key in keys
+    ) and max(keys) < 2 * len(keys) + 16
+
+
+class DenseMapping(Mapping):
+    """Read-only mapping of small non-negative integer keys, backed by a tuple.
+
+    Values are stored at the position of their key,
+    with a sentinel for missing keys. As with a dictionary,
+    integral floats (e.g. ``8.0``) find the same value as ``8``.
+
+    Parameters
+    ----------
+        mapping: Dict[int, Any]
+            A dictionary with non-negative integer keys.
+    """
+
+    def __init__(self, mapping: Dict[int, Any]):
+        values = [_MISSING] * (max(mapping, default=-1) + 1)
+        for key, value in mapping.items():
+            values[key] = value
+        self._values = tuple(values)
+        self._len = len(mapping)
+
+    @property
+    def values_by_key(self) -> tuple:
+        """The value of each key, by position, for vectorized gathers.
+
+        Positions without a key hold a sentinel object.
+        """
+        return self._values
+
+    def _position(self, key) -> int:
+        if type(key) is int:
+            return key
+        if isinstance(key, numbers.Integral):
+            return int(key)
+        if isinstance(key, numbers.Real):
+            try:
+                position = int(key)
+            except (ValueError, OverflowError):
+                return -1
+            if position == key:
+                return position
+        return -1
+
+    def __getitem__(self, key):
+        position = key if type(key) is int else self._position(key)
+        if position >= 0:
+            try:
+                value = self._values[position]
+            except IndexError:
+                pass
+            else:
+                if value is not _MISSING:
+                    return value
+        raise KeyError(key)
+
+    def __iter__(self):
+        return (
+            key for key, value in enumerate(self._values)
+            if value is not _MISSING
+        )
+
+    def __len__(self):
+        return self._len
+
+    def __contains__(self, key):
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def __repr__(self):
+        return f"{type(self).__name__}({len(self)} keys)"
+
+
+class RowMapping(Mapping):
+    """Read-only mapping of keys to elements created from row indices.
+
+    Parameters
+    ----------
+        rows: Dict[Any, Union[int, Tuple[int, ...]]]
+            A dictionary of keys to a row index or tuple of row indices.
+        element_at: Callable
+            A function returning the element of a row index.
+    """
+
+    def __init__(self, rows, element_at: Callable):
+        self._rows = rows
+        self._element_at = element_at
+
+    def __getitem__(self, key):
+        rows = self._rows[key]
+        if isinstance(rows, int):
+            return self._element_at(rows)
+        return tuple(map(self._element_at, rows))
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __contains__(self, key):
+        return key in self._rows
+
+    def __repr__(self):
+        return f"{type(self).__name__}({len(self)} keys)"
+
+
 class Elementable(type):
     """Class factory for generating Elements in a container
 
@@ -52,6 +306,10 @@ class Elementable(type):
             This should be formatted as a list of dictionaries.
             Each key in the dictionary should be an attribute name.
             Each value in the dictionary should be the corresponding data value.
+        data: List[Dict[str, Any]]
+            Already-loaded element data, in the same format as ``json_file``.
+            If given, ``json_file`` is not read. The data is not modified,
+            so it can be shared between several tables.
         decimals: int
             The number of decimals to round floating point data to.
             The rounding only occurs when registering elements in dictionaries,
@@ -65,13 +323,59 @@ class Elementable(type):
             as attributes for direct access. By default, key_attr="symbol",
             meaning that the attributes are created from the element symbol.
             The chosen key must correspond to string values on **each**
-            element, and **each value must be unique**.
+            element, and **each value must be unique**. Values cannot be
+            the names of container attributes, e.g. "get" or "search".
         key_transform: Callable
             A function to transform the key for key_attr. This is useful
             for values that are not valid Python identifiers.
             For example, in the default Elements, the empty Element
             (symbol="*") cannot be set as an attribute ``elements.*``.
             The default ``key_transform`` function converts * to X.
+        indexed: List[str]
+            Attributes to build registries for immediately,
+            as well as search indices for those with string values.
+            By default, the registry and search index for each attribute
+            are only built the first time they are used.
+        schema: Dict[str, Type]
+            An explicit type for each attribute (e.g. ``Optional[float]``).
+            If given, types are not inferred from the data; instead
+            every value is checked against its declared type,
+            and an error is raised for any mismatch or undeclared attribute.
+            Integers are accepted (and converted) for float attributes,
+            and ``None`` only for ``Optional`` attributes.
+        lazy: bool
+            Whether to store element data in columns and only create
+            each ``Element`` when it is first accessed.
+            Created elements are kept in a cache so that the same object
+            is returned while it is in use. If the element class supports
+            weak references (e.g. :class:`CompactElement`), elements are
+            released when they are no longer referenced elsewhere.
+        defer_units: bool
+            Whether to store bare magnitudes on each ``Element`` and only
+            attach ``units`` when the attribute is accessed.
+            Quantities are cached and shared between elements with the
+            same value, so building the table is nearly as fast as without units.
+            Exported data (e.g. JSON) contain the bare magnitudes.
+        normalization_cache: int or Dict[str, int]
+            The size of a least-recently-used cache of raw query values
+            to elements, for attributes whose queries are normalized
+            (with converters, units or rounding). This helps when
+            converters are expensive. A dictionary gives the size for
+            each attribute to cache. By default, nothing is cached.
+            The cache is bypassed while statistics or a tracer are enabled.
+        resolution: Dict[str, float]
+            A resolution for numeric attributes (e.g. ``{"mass": 1e-4}``)
+            to store as integer keys instead of rounding to ``decimals``.
+            Keys of these registries are ``round(value / resolution)``,
+            and queries are quantized the same way. This allows a
+            different precision for each attribute, and vectorized
+            lookups with :meth:`rows_array`.
+        result_cache: int
+            The size of a least-recently-used cache of the results of
+            queries on several attributes, keyed on the normalized query.
+            Results are the same immutable tuples as without the cache.
+            By default, results are not cached.
+            The cache is bypassed while statistics or a tracer are enabled.
 
     Returns
     -------
@@ -123,46 +427,90 @@ class Elementable(type):
         decimals: Optional[int] = 4,
         key_attr: str = "symbol",
         key_transform: Callable = lambda x: x if x != "*" else "X",
+        indexed: Optional[List[str]] = None,
+        schema: Optional[Dict[str, Type]] = None,
+        lazy: bool = False,
+        defer_units: bool = False,
+        data: Optional[List[Dict[str, Any]]] = None,
+        normalization_cache: Union[int, Dict[str, int], None] = None,
+        resolution: Optional[Dict[str, float]] = None,
+        result_cache: Optional[int] = None,
     ):
 
         # ===== load elements from json =====
-        if json_file is None:
-            json_file = resource_filename(__name__, "data/elements.json")
-
-        with open(str(json_file), "r") as f:
-            contents = json.load(f)
+        start = perf_counter()
+        if data is None:
+            contents = _load_json(json_file)
+        else:
+            contents = data
+        hooks._emit("load", start, size=len(contents))
 
         # ===== gather attribute types and convert values =====
+        start = perf_counter()
+        stored_units = {} if defer_units else units
         attr_types = {}
         initial_attr_types = {}
         converted_element_dictionaries = []
-        for element_dictionary in contents:
-            new_item = {}
-            for attr_name, attr_value in element_dictionary.items():
-                initial_type = type(attr_value)
-                if attr_name in converters:
-                    attr_value = converters[attr_name](attr_value)
-                if attr_name in units and attr_value is not None:
-                    attr_value = attr_value * units[attr_name]
-                attr_type = type(attr_value)
-                if attr_name in attr_types:
-                    existing = attr_types[attr_name]
-                    attr_type = _resolve_multiple_types(attr_type, existing)
-                    initial_existing = initial_attr_types[attr_name]
-                    initial_type = _resolve_multiple_types(
-                        initial_existing,
-                        initial_type,
-                    )
-
-                attr_types[attr_name] = attr_type
+        if schema is not None:
+            _validate_schema(contents, schema)
+            for attr_name, attr_type in schema.items():
+                initial_type = _strip_optional(attr_type)
                 initial_attr_types[attr_name] = initial_type
-                new_item[attr_name] = attr_value
-            converted_element_dictionaries.append(new_item)
+                if attr_name in stored_units:
+                    unit_type = type(initial_type(0) * stored_units[attr_name])
+                    if initial_type is not attr_type:
+                        unit_type = Optional[unit_type]
+                    attr_type = unit_type
+                attr_types[attr_name] = attr_type
 
-        initial_attr_types = {
-            k: v if v != Optional[float] else float
-            for k, v in initial_attr_types.items()
-        }
+            transformed = [
+                attr_name for attr_name in attr_types
+                if attr_name in converters or attr_name in stored_units
+                or initial_attr_types[attr_name] is float
+            ]
+            for element_dictionary in contents:
+                new_item = dict(element_dictionary)
+                for attr_name in transformed:
+                    attr_value = new_item.get(attr_name)
+                    if attr_value is None:
+                        continue
+                    if initial_attr_types[attr_name] is float:
+                        attr_value = float(attr_value)
+                    if attr_name in converters:
+                        attr_value = converters[attr_name](attr_value)
+                    if attr_name in stored_units:
+                        attr_value = attr_value * stored_units[attr_name]
+                    new_item[attr_name] = attr_value
+                converted_element_dictionaries.append(new_item)
+        else:
+            for element_dictionary in contents:
+                new_item = {}
+                for attr_name, attr_value in element_dictionary.items():
+                    initial_type = type(attr_value)
+                    if attr_name in converters:
+                        attr_value = converters[attr_name](attr_value)
+                    if attr_name in stored_units and attr_value is not None:
+                        attr_value = attr_value * stored_units[attr_name]
+                    attr_type = type(attr_value)
+                    if attr_name in attr_types:
+                        existing = attr_types[attr_name]
+                        attr_type = _resolve_multiple_types(attr_type, existing)
+                        initial_existing = initial_attr_types[attr_name]
+                        initial_type = _resolve_multiple_types(
+                            initial_existing,
+                            initial_type,
+                        )
+
+                    attr_types[attr_name] = attr_type
+                    initial_attr_types[attr_name] = initial_type
+                    new_item[attr_name] = attr_value
+                converted_element_dictionaries.append(new_item)
+
+            initial_attr_types = {
+                k: v if v != Optional[float] else float
+                for k, v in initial_attr_types.items()
+            }
+        hooks._emit("types", start, size=len(attr_types))
 
         # ===== class definition =====
 
@@ -172,59 +520,200 @@ class Elementable(type):
 
         Element = new_class("Element", (element_cls,), exec_body=annotate)
 
-        # ===== define and register elements =====
-        registries = {k: defaultdict(list) for k in attr_types}
+        if defer_units:
+            for attr_name, unit in units.items():
+                if attr_name in attr_types:
+                    setattr(Element, attr_name, property(
+                        _deferred_unit_getter(Element, attr_name, unit)
+                    ))
+
+        # ===== define elements =====
+        start = perf_counter()
+        initial_new = Element.__new__
+        initial_init = Element.__init__
 
         if issubclass(Element, tuple):
             def create(kwargs):
-                return Element(*[kwargs.get(k) for k in attr_types])
+                return initial_new(Element, *[kwargs.get(k) for k in attr_types])
         else:
             def create(kwargs):
-                return Element(**kwargs)
+                el = initial_new(Element)
+                initial_init(el, **kwargs)
+                return el
+
+        columns = {
+            attr_name: [
+                element_dictionary.get(attr_name)
+                for element_dictionary in converted_element_dictionaries
+            ]
+            for attr_name in attr_types
+        }
+        n_elements = len(converted_element_dictionaries)
 
-        all_elements = []
-        for element_dictionary in converted_element_dictionaries:
-            el = create(element_dictionary)
-            for attr_name, registry in registries.items():
-                key = element_dictionary.get(attr_name)
+        # ===== canonical identity =====
+        # each row has one canonical element, so equality and hashing
+        # are by identity rather than comparing every attribute.
+        # All rich comparisons are replaced so that CPython uses the
+        # C comparison of object rather than calling back into Python.
+        initial_eq = Element.__eq__
+
+        def value_equals(self, other) -> bool:
+            """Whether all attributes are equal, as for the base class"""
+            return initial_eq(self, other) is True
+
+        comparisons = ("__eq__", "__ne__", "__lt__", "__le__", "__gt__", "__ge__")
+        for comparison in comparisons:
+            setattr(Element, comparison, getattr(object, comparison))
+        Element.__hash__ = object.__hash__
+        if "value_equals" not in attr_types:
+            Element.value_equals = value_equals
+
+        # the row of each canonical element, found by identity
+        if lazy:
+            if Element.__weakrefoffset__:
+                element_cache = WeakValueDictionary()
+                element_rows = WeakKeyDictionary()
+            else:
+                element_cache = {}
+                element_rows = {}
+
+            cache_lock = threading.Lock()
+
+            def element_at(row):
+                try:
+                    return element_cache[row]
+                except KeyError:
+                    pass
+                with cache_lock:
+                    el = element_cache.get(row)
+                    if el is None:
+                        el = create({
+                            k: column[row] for k, column in columns.items()
+                        })
+                        element_cache[row] = el
+                        element_rows[el] = row
+                return el
+        else:
+            all_elements = [
+                create(element_dictionary)
+                for element_dictionary in converted_element_dictionaries
+            ]
+            element_at = all_elements.__getitem__
+            element_rows = {el: row for row, el in enumerate(all_elements)}
+        del converted_element_dictionaries
+        hooks._emit("elements", start, size=n_elements)
+
+        # ===== registries are built on first access =====
+        def build_column(attr_name):
+            values = columns[attr_name]
+            if attr_name in stored_units:
+                initial_type = initial_attr_types[attr_name]
+                unit = stored_units[attr_name]
+                values = [
+                    initial_type(value / unit) if value is not None else None
+                    for value in values
+                ]
+            return tuple(values)
+
+        def build_search_index(attr_name):
+            return StringIndex(columns[attr_name])
+
+        def has_string_values(attr_name):
+            values = columns[attr_name]
+            return any(isinstance(v, str) for v in values) and all(
+                v is None or isinstance(v, str) for v in values
+            )
+
+        def build_row_registry(attr_name):
+            registry = defaultdict(list)
+            step = resolution.get(attr_name)
+            round_keys = (
+                initial_attr_types[attr_name] == float
+                and decimals is not None
+            )
+            for row, key in enumerate(build_column(attr_name)):
                 if key is not None:
-                    initial_type = initial_attr_types[attr_name]
-                    if attr_name in units:
-                        key = initial_type(key / units[attr_name])
-                    if initial_type == float and decimals is not None:
+                    if step is not None:
+                        key = round(key / step)
+                    elif round_keys:
                         key = round(key, decimals)
-                    registry[key].append(el)
-            all_elements.append(el)
+                    registry[key].append(row)
 
-        clean_registries = {}
-        for regname, regvalue in registries.items():
-            if all(len(v) == 1 for v in regvalue.values()):
-                regvalue = {k: v[0] for k, v in regvalue.items()}
+            if all(len(v) == 1 for v in registry.values()):
+                registry = {k: v[0] for k, v in registry.items()}
             else:
-                regvalue = {k: tuple(v) for k, v in regvalue.items()}
+                registry = {k: tuple(v) for k, v in registry.items()}
+            if _is_dense(registry):
+                return DenseMapping(registry)
+            return registry
 
-            clean_registries[regname] = regvalue
+        def build_registry(attr_name):
+            start = perf_counter()
+            registry = build_row_registry(attr_name)
+            if lazy:
+                registry = RowMapping(registry, element_at)
+            else:
+                registry = MappingProxyType({
+                    k: (
+                        element_at(v) if isinstance(v, int)
+                        else tuple(map(element_at, v))
+                    )
+                    for k, v in registry.items()
+                })
+            hooks._emit(
+                "registry", start, attribute=attr_name, size=len(registry)
+            )
+            return registry
 
         # create container
-        sorted_attrs = sorted(registries)
-        Registry = namedtuple("Registry", sorted_attrs)
-        proxies = [MappingProxyType(clean_registries[k]) for k in sorted_attrs]
+        start = perf_counter()
+        sorted_attrs = sorted(attr_types)
+        resolution = dict(resolution or {})
+        for attr_name, step in resolution.items():
+            if attr_name not in attr_types:
+                raise ElementableError(
+                    f"Cannot quantize {attr_name}: attribute not supported"
+                )
+            if initial_attr_types[attr_name] not in (int, float) or not step > 0:
+                raise ElementableError(
+                    f"Cannot quantize {attr_name}: resolution must be positive "
+                    "and the attribute numeric"
+                )
+        registry = Registry({k: build_registry for k in sorted_attrs})
+        row_registries = Registry({k: build_row_registry for k in sorted_attrs})
+        column_cache = Registry({k: build_column for k in sorted_attrs})
+        search_indices = Registry({k: build_search_index for k in sorted_attrs})
+        if indexed is not None:
+            for attr_name in indexed:
+                if attr_name not in attr_types:
+                    raise ElementableError(
+                        f"Cannot index {attr_name}: attribute not supported"
+                    )
+                getattr(registry, attr_name)
+                if has_string_values(attr_name):
+                    getattr(search_indices, attr_name)
 
-        keys = [key_transform(getattr(el, key_attr)) for el in all_elements]
+        keys = [key_transform(key) for key in columns[key_attr]]
         Elements = namedtuple("Elements", keys)
 
-        Elements.registry = Registry(*proxies)
+        Elements.registry = registry
 
         # ===== overwrite __new__ and __init__ =====
 
-        def _get_key_and_value(key, value, getter):
-            try:
-                registry = getter(key)
-            except (AttributeError, KeyError):
+        def _check_attribute(key):
+            if key not in attr_types:
                 raise ElementableError(
                     f"{key} attribute not supported. Available keys: "
-                    ", ".join(sorted_attrs)
+                    + ", ".join(sorted_attrs)
                 )
+
+        def _get_registry(key):
+            try:
+                return getattr(Elements.registry, key)
+            except AttributeError:
+                _check_attribute(key)
+
+        def _normalize(key, value):
             if key in converters:
                 value = converters[key](value)
 
@@ -233,34 +722,110 @@ class Elementable(type):
                 value /= units[key]
                 value = initial_attr_types[key](value)
 
-            if (initial_attr_types[key] == float
+            if key in resolution:
+                value = round(value / resolution[key])
+            elif (initial_attr_types[key] == float
                     and decimals is not None):
                 value = round(value, decimals)
+            return value
 
+        def _get_key_and_value(key, value):
+            registry = _get_registry(key)
+            value = _normalize(key, value)
             try:
                 return registry[value]
             except KeyError:
                 raise InvalidElementError(f"{key}={value}")
 
+        # ===== normalization caches =====
+        normalized_attrs = [
+            attr_name for attr_name in sorted_attrs
+            if attr_name in converters or attr_name in units
+            or attr_name in resolution
+            or (initial_attr_types[attr_name] == float and decimals is not None)
+        ]
+        if isinstance(normalization_cache, int):
+            normalization_cache = {
+                attr_name: normalization_cache
+                for attr_name in normalized_attrs
+            }
+        normalization_caches = {}
+        for attr_name, maxsize in (normalization_cache or {}).items():
+            _check_attribute(attr_name)
+            if maxsize:
+                normalization_caches[attr_name] = NormalizationCache(
+                    functools.partial(_get_key_and_value, attr_name),
+                    maxsize,
+                )
+
+        if normalization_caches:
+            uncached_get_key_and_value = _get_key_and_value
+
+            def _get_key_and_value(key, value):
+                try:
+                    cache = normalization_caches[key]
+                except KeyError:
+                    return uncached_get_key_and_value(key, value)
+                return cache(value)
+
+        def _normalize_query(kwargs):
+            """Return the sorted ``(attribute, normalized value)`` pairs"""
+            return tuple(
+                (key, _normalize(key, kwargs[key]))
+                for key in sorted(kwargs)
+                if kwargs[key] is not None
+            )
+
         def _retrieve_element(cls, *args, **kwargs):
             if not kwargs and args:
                 kwargs = {k: x for k, x in zip(attr_types, args)}
             if len(kwargs) == 1:
                 key = list(kwargs)[0]
-                return _get_key_and_value(
-                    key, kwargs[key], Elements.registry.__getattribute__,
-                )
+                return _get_key_and_value(key, kwargs[key])
 
-            element_group = list(all_elements)
+            element_group = None
             for k, v in kwargs.items():
-                if v is not None:
-                    sub_group = _get_key_and_value(
-                        k, v, registries.__getitem__,
-                    )
-                element_group = [x for x in element_group if x in sub_group]
+                if v is None:
+                    continue
+                try:
+                    sub_group = _get_key_and_value(k, v)
+                except InvalidElementError:
+                    return ()
+                if isinstance(sub_group, Element):
+                    sub_group = (sub_group,)
+                if element_group is None:
+                    element_group = sub_group
+                else:
+                    element_group = [
+                        x for x in element_group if x in sub_group
+                    ]
+            if element_group is None:
+                return tuple(map(element_at, range(n_elements)))
             return tuple(element_group)
 
-        initial_new = Element.__new__
+        # ===== result cache =====
+        uncached_retrieve_element = _retrieve_element
+        results = LRUCache(result_cache) if result_cache else None
+
+        if results is not None:
+            def _retrieve_element(cls, *args, **kwargs):
+                if not kwargs and args:
+                    kwargs = {k: x for k, x in zip(attr_types, args)}
+                if len(kwargs) < 2:
+                    return uncached_retrieve_element(cls, **kwargs)
+                for key in kwargs:
+                    _check_attribute(key)
+                try:
+                    query = _normalize_query(kwargs)
+                    hash(query)
+                except Exception:
+                    # invalid or unhashable values are not cached
+                    return uncached_retrieve_element(cls, **kwargs)
+                result = results.get(query)
+                if result is None:
+                    result = uncached_retrieve_element(cls, **kwargs)
+                    results.put(query, result)
+                return result
 
         def _element_new(cls, *args, **kwargs):
             if not len(kwargs):
@@ -278,16 +843,879 @@ class Elementable(type):
         def dummy(self, **kwargs):
             pass  # pragma: no cover
 
-        n_elements = len(all_elements)
+        # ===== opt-in instrumentation =====
+        # instrumented versions are swapped in when statistics or
+        # a tracer are enabled, so that otherwise they cost nothing
+        lookup_stats = LookupStats()
+        stats_enabled = False
+        plain_get_key_and_value = _get_key_and_value
+        plain_retrieve_element = _retrieve_element
+
+        def instrumented_get_key_and_value(key, value):
+            start = perf_counter()
+            registry = _get_registry(key)
+            value = _normalize(key, value)
+            try:
+                result = registry[value]
+            except KeyError:
+                if stats_enabled:
+                    lookup_stats.record(key, perf_counter() - start, hit=False)
+                hooks._emit("lookup", start, attribute=key, key=value, size=0)
+                raise InvalidElementError(f"{key}={value}")
+            if stats_enabled:
+                lookup_stats.record(key, perf_counter() - start)
+            size = 1 if isinstance(result, Element) else len(result)
+            hooks._emit("lookup", start, attribute=key, key=value, size=size)
+            return result
+
+        def instrumented_retrieve_element(cls, *args, **kwargs):
+            if not kwargs and args:
+                kwargs = {k: x for k, x in zip(attr_types, args)}
+            if len(kwargs) < 2:
+                return plain_retrieve_element(cls, **kwargs)
+            query = None
+            if hooks.get_tracer() is not None:
+                try:
+                    query = _normalize_query(kwargs)
+                except Exception:
+                    # the error is raised by the lookup itself below
+                    query = tuple(sorted(kwargs.items()))
+            start = perf_counter()
+            result = uncached_retrieve_element(cls, **kwargs)
+            if stats_enabled:
+                lookup_stats.record_multiple(
+                    perf_counter() - start,
+                    hit=bool(len(result)),
+                )
+            if query is not None:
+                hooks._emit(
+                    "query",
+                    start,
+                    attribute=",".join(key for key, _ in query),
+                    key=query,
+                    size=len(result),
+                )
+            return result
+
+        def refresh_instrumentation():
+            nonlocal _get_key_and_value, _retrieve_element
+            if stats_enabled or hooks.get_tracer() is not None:
+                _get_key_and_value = instrumented_get_key_and_value
+                _retrieve_element = instrumented_retrieve_element
+            else:
+                _get_key_and_value = plain_get_key_and_value
+                _retrieve_element = plain_retrieve_element
+            ElementsClass.__call__ = _retrieve_element
+            if _get_key_and_value is plain_get_key_and_value:
+                accessors.update(plain_accessors)
+            else:
+                accessors.update(instrumented_accessors)
+            for attr_name, accessor in accessors.items():
+                accessor_name = f"by_{attr_name}"
+                if accessor_name not in ElementsClass._fields:
+                    setattr(ElementsClass, accessor_name, accessor)
+
+        def enable_stats(self, enabled: bool = True):
+            """Turn recording of lookup statistics on or off"""
+            nonlocal stats_enabled
+            stats_enabled = enabled
+            refresh_instrumentation()
+
+        def stats(self):
+            """Return lookup counts, hits, misses and latencies.
+
+            Statistics are only recorded after calling ``enable_stats()``.
+            Lookups are reported per attribute under "attributes",
+            and queries with several attributes under "multiple".
+            Times are in seconds.
+            """
+            summary = lookup_stats.summary()
+            summary["enabled"] = stats_enabled
+            return summary
+
+        def reset_stats(self):
+            """Clear all recorded lookup statistics"""
+            lookup_stats.reset()
+
+        def cache_info(self) -> Dict[str, Any]:
+            """Return the size and hit statistics of each cache.
+
+            Normalization caches (see the ``normalization_cache`` option)
+            are reported per attribute under "normalization", and the
+            result cache (see the ``result_cache`` option) under "results".
+            """
+            return {
+                "normalization": {
+                    attr_name: cache.info()
+                    for attr_name, cache in normalization_caches.items()
+                },
+                "results": results.info() if results is not None else None,
+            }
+
+        def clear_caches(self):
+            """Empty all caches and reset their statistics"""
+            for cache in normalization_caches.values():
+                cache.clear()
+            if results is not None:
+                results.clear()
+
+        # ===== non-raising lookups =====
+
+        def get(self, default=None, **kwargs):
+            """Return the element(s) matching the query, or ``default``.
+
+            Unlike calling the container, a value that is not found
+            returns ``default`` instead of raising an error.
+            An unsupported attribute still raises an ``ElementableError``.
+            """
+            if len(kwargs) == 1:
+                [(key, value)] = kwargs.items()
+                registry = _get_registry(key)
+                try:
+                    return registry.get(_normalize(key, value), default)
+                except Exception:
+                    return default
+            for key in kwargs:
+                _get_registry(key)
+            try:
+                possibilities = _retrieve_element(self, **kwargs)
+            except Exception:
+                return default
+            return possibilities if len(possibilities) else default
+
+        def validate(self, attr_name: str, values) -> List[bool]:
+            """Check whether each value matches an element.
+
+            Values are normalized the same way as in searches,
+            i.e. with converters, unit conversion and rounding.
+            Invalid values are ``False`` rather than raising an error.
+
+            Parameters
+            ----------
+                attr_name: str
+                    The attribute to search, e.g. "symbol"
+                values: Iterable
+                    The values to check
+
+            Returns
+            -------
+                mask: List[bool]
+                    Whether each value corresponds to an element
+            """
+            registry = _get_registry(attr_name)
+            checked = {}
+            mask = []
+            for value in values:
+                try:
+                    mask.append(checked[value])
+                    continue
+                except KeyError:
+                    hashable = True
+                except TypeError:
+                    hashable = False
+                try:
+                    valid = _normalize(attr_name, value) in registry
+                except Exception:
+                    valid = False
+                if hashable:
+                    checked[value] = valid
+                mask.append(valid)
+            return mask
+
+        # ===== column access =====
+
+        def column(self, attr_name: str) -> tuple:
+            """Return the value of an attribute for every element, in order.
+
+            Values are bare magnitudes in the units of the table.
+            Missing values are ``None``.
+            """
+            _check_attribute(attr_name)
+            return getattr(column_cache, attr_name)
+
+        def rows(self, attr_name: str, values) -> List[int]:
+            """Return the row of the element matching each value.
+
+            Values are normalized the same way as in searches.
+            Values that do not match an element have a row of -1.
+            The attribute must have a unique value for each element.
+            """
+            _check_attribute(attr_name)
+            row_registry = getattr(row_registries, attr_name)
+            checked = {}
+            element_rows = []
+            for value in values:
+                try:
+                    element_rows.append(checked[value])
+                    continue
+                except KeyError:
+                    hashable = True
+                except TypeError:
+                    hashable = False
+                try:
+                    row = row_registry.get(_normalize(attr_name, value), -1)
+                except Exception:
+                    row = -1
+                if not isinstance(row, int):
+                    raise ElementableError(
+                        f"{attr_name} does not have unique values"
+                    )
+                if hashable:
+                    checked[value] = row
+                element_rows.append(row)
+            return element_rows
+
+        array_lock = threading.Lock()
+        array_cache = {}
+
+        def rows_array(self, attr_name: str, values):
+            """Return the row of the element matching each value as an array.
+
+            This is a vectorized version of :meth:`rows`. Registries
+            of small non-negative integers (e.g. ``atomic_number``)
+            are backed by a dense array, and attributes with a
+            ``resolution`` are quantized and binary searched,
+            so numeric arrays of values are looked up without a Python loop.
+            Values that do not match an element have a row of -1.
+            Requires NumPy.
+
+            Parameters
+            ----------
+                attr_name: str
+                    The attribute to search, e.g. "atomic_number"
+                values: numpy.ndarray
+                    The values to search
+
+            Returns
+            -------
+                rows: numpy.ndarray
+                    An array of the same shape as ``values``
+            """
+            import numpy as np
+            from .arrays import (
+                dense_row_table,
+                gather_rows,
+                search_rows,
+                sorted_row_table,
+            )
+
+            _check_attribute(attr_name)
+            row_registry = getattr(row_registries, attr_name)
+            values = np.asarray(values)
+            dense = isinstance(row_registry, DenseMapping)
+            if (
+                (dense or attr_name in resolution)
+                and values.dtype.kind in "iuf"
+                and attr_name not in converters
+                and attr_name not in units
+            ):
+                if attr_name in resolution:
+                    values = np.rint(values / resolution[attr_name])
+                key = ("rows", attr_name)
+                with array_lock:
+                    if key not in array_cache:
+                        array_cache[key] = (
+                            dense_row_table(row_registry.values_by_key)
+                            if dense
+                            else sorted_row_table(row_registry)
+                        )
+                    table = array_cache[key]
+                if dense:
+                    return gather_rows(table, values)
+                return search_rows(*table, values)
+            rows = self.rows(attr_name, values.ravel().tolist())
+            return np.array(rows, dtype=np.intp).reshape(values.shape)
+
+        def rows_of(self, elements):
+            """Return the row of each element as an array.
+
+            Rows are found by the identity of each element with a single
+            dictionary lookup, without a Python attribute lookup per item.
+            This works with every base class, including NamedTuple
+            elements, which NumPy cannot convert to rows itself
+            as it treats them as sequences.
+            Objects that are not elements of this container have a row of -1.
+            Requires NumPy.
+
+            Parameters
+            ----------
+                elements: Iterable
+                    The elements, e.g. one per atom
+
+            Returns
+            -------
+                rows: numpy.ndarray
+                    An array of shape ``(len(elements),)``
+
+            Examples
+            --------
+            ::
+
+                masses = np.array(Elements.column("mass"))
+                masses[Elements.rows_of([Elements.H, Elements.O])]
+                np.bincount(Elements.rows_of(atoms), minlength=Elements.n_elements)
+            """
+            import numpy as np
+
+            if not isinstance(elements, (list, tuple)):
+                elements = list(elements)
+            try:
+                return np.fromiter(
+                    map(element_rows.__getitem__, elements),
+                    dtype=np.intp,
+                    count=len(elements),
+                )
+            except (KeyError, TypeError):
+                pass
+
+            def row_of(el):
+                if type(el) is not Element:
+                    return -1
+                row = element_rows.get(el)
+                if row is None:
+                    row = key_rows.get(getattr(el, key_attr), -1)
+                return row
+
+            return np.fromiter(
+                map(row_of, elements), dtype=np.intp, count=len(elements)
+            )
+
+        def pairwise(
+            self,
+            attr_name: str,
+            op: Union[str, Callable] = "sum",
+            tolerance: float = 0.0,
+        ):
+            """Return a matrix combining an attribute for every pair of elements.
+
+            For example, ``pairwise("covalent_radius", tolerance=0.45)``
+            gives the bond cutoff for each pair of elements.
+            The matrix is indexed by element row, so cutoffs for many
+            pairs can be gathered at once: ``matrix[rows_i, rows_j]``.
+            Missing values are NaN. Matrices are read-only, and cached
+            for the named operations; a function is called every time,
+            as each new function would otherwise add a matrix to the cache.
+            Requires NumPy.
+
+            Parameters
+            ----------
+                attr_name: str
+                    A numeric attribute, e.g. "covalent_radius"
+                op: str or Callable
+                    How to combine each pair. One of "sum", "difference",
+                    "product", "min", "max", "mean" or "geometric";
+                    or a function that takes two broadcastable arrays.
+                tolerance: float
+                    A value added to each combined pair
+
+            Returns
+            -------
+                matrix: numpy.ndarray
+                    An array of shape ``(n_elements, n_elements)``
+            """
+            from .arrays import column_array, pairwise_array
+
+            _check_attribute(attr_name)
+            key = ("pairwise", attr_name, op, tolerance)
+            with array_lock:
+                if key in array_cache:
+                    return array_cache[key]
+                values = array_cache.get(("column", attr_name))
+                if values is None:
+                    values = column_array(self, attr_name)
+                    array_cache[("column", attr_name)] = values
+            matrix = pairwise_array(values, op, tolerance)
+            matrix.setflags(write=False)
+            if isinstance(op, str):
+                with array_lock:
+                    matrix = array_cache.setdefault(key, matrix)
+            return matrix
+
+        def perceive_bonds(
+            self,
+            element_rows,
+            coordinates,
+            box=None,
+            tolerance: float = 0.45,
+            **kwargs,
+        ):
+            """Find bonds between atoms from their covalent radii.
+
+            Atoms are bonded if their distance is at most the sum
+            of their ``covalent_radius`` plus ``tolerance``.
+            See :func:`elementable.bonds.perceive_bonds` for all options.
+            Requires NumPy.
+
+            Parameters
+            ----------
+                element_rows: numpy.ndarray
+                    The row of the element of each atom, shape ``(n_atoms,)``
+                coordinates: numpy.ndarray
+                    The coordinates of each atom, shape ``(n_atoms, 3)``,
+                    in the same units as the radii
+                box: numpy.ndarray
+                    The lengths of an orthorhombic periodic box, shape ``(3,)``
+                tolerance: float
+                    A value added to the sum of the radii
+
+            Returns
+            -------
+                bonds: numpy.ndarray
+                    The atom indices of each bond, shape ``(n_bonds, 2)``
+            """
+            from .bonds import perceive_bonds
+
+            return perceive_bonds(
+                self,
+                element_rows,
+                coordinates,
+                box=box,
+                tolerance=tolerance,
+                **kwargs,
+            )
+
+        def total_mass(self, element_rows, groups=None, **kwargs):
+            """Sum the masses of atoms, optionally per group.
+
+            See :func:`elementable.reductions.total_mass`.
+            Requires NumPy.
+            """
+            from .reductions import total_mass
+
+            return total_mass(self, element_rows, groups=groups, **kwargs)
+
+        def center_of_mass(self, element_rows, frames, groups=None, **kwargs):
+            """Compute the center of mass of atoms, per frame and optionally group.
+
+            See :func:`elementable.reductions.center_of_mass`.
+            Requires NumPy.
+            """
+            from .reductions import center_of_mass
+
+            return center_of_mass(
+                self, element_rows, frames, groups=groups, **kwargs
+            )
+
+        def radius_of_gyration(self, element_rows, frames, groups=None, **kwargs):
+            """Compute the radius of gyration, per frame and optionally group.
+
+            See :func:`elementable.reductions.radius_of_gyration`.
+            Requires NumPy.
+            """
+            from .reductions import radius_of_gyration
+
+            return radius_of_gyration(
+                self, element_rows, frames, groups=groups, **kwargs
+            )
+
+        string_attrs = None
+
+        def search(
+            self,
+            prefix: Optional[str] = None,
+            contains: Optional[str] = None,
+            attr_name: Optional[str] = None,
+        ) -> tuple:
+            """Find elements with a string attribute that matches a prefix or substring.
+
+            Searches are case-insensitive and use an index that is
+            built the first time each attribute is searched,
+            so they do not scan every element.
+
+            Parameters
+            ----------
+                prefix: str
+                    Match values that start with this
+                contains: str
+                    Match values that contain this.
+                    If both are given, values must match both.
+                attr_name: str
+                    The attribute to search. By default, all attributes
+                    with string values are searched.
+
+            Returns
+            -------
+                elements: tuple
+                    The matching elements, in order
+
+            Examples
+            --------
+            ::
+
+                Elements.search(prefix="ch")  # chlorine, chromium
+                Elements.search(contains="ium", attr_name="name")
+            """
+            nonlocal string_attrs
+            if prefix is None and contains is None:
+                raise ElementableError("Either prefix or contains must be given")
+            if attr_name is None:
+                if string_attrs is None:
+                    string_attrs = [
+                        attr_name for attr_name in sorted_attrs
+                        if has_string_values(attr_name)
+                    ]
+                attr_names = string_attrs
+            else:
+                _check_attribute(attr_name)
+                attr_names = [attr_name]
+
+            matches = set()
+            for attr_name in attr_names:
+                index = getattr(search_indices, attr_name)
+                if prefix is not None:
+                    rows = index.prefix(prefix)
+                    if contains is not None:
+                        rows = rows & index.contains(contains)
+                else:
+                    rows = index.contains(contains)
+                matches.update(rows)
+            return tuple(map(element_at, sorted(matches)))
+
+        def fuzzy(
+            self,
+            max_distance: int = 2,
+            limit: Optional[int] = None,
+            **kwargs,
+        ) -> tuple:
+            """Find elements with a string attribute close to a possibly misspelt value.
+
+            Values within ``max_distance`` edits (insertions, deletions
+            or substitutions) of the query are found, case-insensitively.
+            Edit distances are only computed for values of a similar
+            length that share enough n-grams with the query, from the
+            same index as :meth:`search`. The index is built the first
+            time each attribute is searched, or when the container is
+            built for attributes in ``indexed``. Exact matches come first.
+
+            Parameters
+            ----------
+                max_distance: int
+                    The largest number of edits
+                limit: int
+                    The largest number of elements to return
+                **kwargs
+                    One attribute and the value to search for,
+                    e.g. ``name="flourine"``
+
+            Returns
+            -------
+                elements: tuple
+                    The matching elements, closest first.
+                    Elements at the same distance are in order.
+
+            Examples
+            --------
+            ::
+
+                Elements.fuzzy(name="flourine")  # (fluorine,)
+                Elements.fuzzy(name="sulphur")  # (sulfur,)
+            """
+            if len(kwargs) != 1:
+                raise ElementableError("fuzzy searches exactly one attribute")
+            [(attr_name, value)] = kwargs.items()
+            _check_attribute(attr_name)
+            index = getattr(search_indices, attr_name)
+            matches = index.fuzzy(str(value), max_distance)[:limit]
+            return tuple(element_at(row) for _, row in matches)
+
+        guesser_lock = threading.Lock()
+        guessers = []
+
+        def guess(self, name: str, residue: Optional[str] = None, default=None):
+            """Guess an element from a force field atom name or type.
+
+            For example, "CA" is carbon in residue "ALA" but calcium
+            in residue "CA", "HW1" is hydrogen and "CL-" is chlorine.
+            Guesses are cached per name and residue.
+            See :class:`elementable.guessing.ElementGuesser` for the rules,
+            or to configure them.
+
+            Parameters
+            ----------
+                name: str
+                    The atom name or type
+                residue: str
+                    The residue name
+                default: Any
+                    Returned if no element can be guessed
+
+            Returns
+            -------
+                element: Element
+            """
+            if not guessers:
+                from .guessing import ElementGuesser
+
+                _check_attribute("symbol")
+                with guesser_lock:
+                    if not guessers:
+                        guessers.append(ElementGuesser(self))
+            return guessers[0].guess(name, residue, default)
+
+        # ===== specialized accessors =====
+        # the configuration is fixed at this point, so each accessor
+        # only contains the normalization steps that apply to it
+
+        def build_accessor(attr_name):
+            steps = []
+            if attr_name in converters:
+                steps.append(converters[attr_name])
+            if attr_name in units:
+                unit = units[attr_name]
+                initial_type = initial_attr_types[attr_name]
+                steps.append(
+                    lambda value: initial_type(((0 * unit) + value) / unit)
+                )
+            if attr_name in resolution:
+                step = resolution[attr_name]
+                steps.append(lambda value: round(value / step))
+            elif initial_attr_types[attr_name] == float and decimals is not None:
+                steps.append(lambda value: round(value, decimals))
+
+            def first_lookup(value):
+                # the registry is only built on first use
+                nonlocal lookup
+                lookup = getattr(Elements.registry, attr_name).__getitem__
+                return lookup(value)
+
+            lookup = first_lookup
+
+            if not steps:
+                def accessor(self, value):
+                    try:
+                        return lookup(value)
+                    except KeyError:
+                        raise InvalidElementError(f"{attr_name}={value}")
+            elif len(steps) == 1:
+                [normalize] = steps
+
+                def accessor(self, value):
+                    value = normalize(value)
+                    try:
+                        return lookup(value)
+                    except KeyError:
+                        raise InvalidElementError(f"{attr_name}={value}")
+            else:
+                def accessor(self, value):
+                    for step in steps:
+                        value = step(value)
+                    try:
+                        return lookup(value)
+                    except KeyError:
+                        raise InvalidElementError(f"{attr_name}={value}")
+
+            if attr_name in normalization_caches:
+                cache = normalization_caches[attr_name]
+
+                def accessor(self, value):
+                    return cache(value)
+
+            return accessor
+
+        def build_instrumented_accessor(attr_name):
+            def accessor(self, value):
+                return _get_key_and_value(attr_name, value)
+            return accessor
+
+        plain_accessors = {}
+        instrumented_accessors = {}
+        for attr_name in sorted_attrs:
+            accessor_name = f"by_{attr_name}"
+            for accessors, build in (
+                (plain_accessors, build_accessor),
+                (instrumented_accessors, build_instrumented_accessor),
+            ):
+                accessor = build(attr_name)
+                accessor.__name__ = accessor_name
+                accessor.__doc__ = (
+                    f"Return the element(s) with the given {attr_name}.\n\n"
+                    f"This is equivalent to ``Elements({attr_name}=value)``, "
+                    "but faster."
+                )
+                accessors[attr_name] = accessor
+        accessors = dict(plain_accessors)
+
+        frame_lock = threading.Lock()
+        frame_cache = []
+
+        def cached_frame(self):
+            with frame_lock:
+                if not frame_cache:
+                    from .dataframe import elements_to_frame
+                    frame = elements_to_frame(self)
+                    values = {}
+                    for attr_name in frame.columns:
+                        array = frame[attr_name].to_numpy(copy=True)
+                        array.setflags(write=False)
+                        values[attr_name] = array
+                    frame_cache.append((frame, values))
+            return frame_cache[0]
+
+        def to_frame(self):
+            """Return a pandas DataFrame of all attributes, indexed by row.
+
+            Each call returns a copy of a cached DataFrame,
+            so it can be modified without affecting the elements.
+            Values are bare magnitudes in the units of the table.
+            """
+            return cached_frame(self)[0].copy()
+
+        def _attribute_values(self, attr_name: str):
+            """Return a read-only array of an attribute, as in :meth:`to_frame`"""
+            _check_attribute(attr_name)
+            return cached_frame(self)[1][attr_name]
+
+        # ===== integer protocol =====
+        key_rows = {key: row for row, key in enumerate(columns[key_attr])}
+
+        def _element_row(self):
+            try:
+                return element_rows[self]
+            except KeyError:
+                # copies share the key of the canonical element
+                return key_rows[getattr(self, key_attr)]
+
+        Element.__index__ = _element_row
+        if "row" not in attr_types:
+            Element.row = property(_element_row, doc="The row of the element")
 
         Element.__new__ = _element_new
         Element.__init__ = dummy
-        Elements.__call__ = _retrieve_element
-        Elements.n_elements = n_elements
-        Elements.element_class = Element
+        Element.__setattr__ = _read_only
+        Element.__delattr__ = _read_only
+        ElementsClass = Elements
+        container_attributes = {
+            "_refresh_instrumentation": staticmethod(refresh_instrumentation),
+            "enable_stats": enable_stats,
+            "stats": stats,
+            "reset_stats": reset_stats,
+            "cache_info": cache_info,
+            "clear_caches": clear_caches,
+            "get": get,
+            "validate": validate,
+            "column": column,
+            "rows": rows,
+            "to_frame": to_frame,
+            "_attribute_values": _attribute_values,
+            "rows_array": rows_array,
+            "rows_of": rows_of,
+            "pairwise": pairwise,
+            "perceive_bonds": perceive_bonds,
+            "total_mass": total_mass,
+            "center_of_mass": center_of_mass,
+            "radius_of_gyration": radius_of_gyration,
+            "guess": guess,
+            "search": search,
+            "fuzzy": fuzzy,
+            "key_attr": key_attr,
+            "n_elements": n_elements,
+            "element_class": Element,
+        }
+        # element keys would otherwise hide container methods, or be
+        # hidden by them, depending on whether the container is lazy
+        reserved_keys = sorted(
+            ({"registry"} | set(container_attributes)) & set(Elements._fields)
+        )
+        if reserved_keys:
+            raise ElementableError(
+                f"Cannot use {', '.join(reserved_keys)} as {key_attr} keys: "
+                "reserved for the container"
+            )
+        for name, value in container_attributes.items():
+            setattr(Elements, name, value)
+
+        if lazy:
+            # the container only holds rows; elements are created on access
+            for row, field in enumerate(Elements._fields):
+                setattr(Elements, field, property(
+                    lambda self, row=row: element_at(row)
+                ))
+
+            def _getitem(self, index):
+                if isinstance(index, slice):
+                    return tuple(map(element_at, range(n_elements)[index]))
+                return element_at(range(n_elements)[index])
+
+            def _iter(self):
+                return map(element_at, range(n_elements))
+
+            def _contains(self, item):
+                return any(item is el for el in element_cache.values())
+
+            # the tuple methods would otherwise compare the stored rows
+            def _row_of(item):
+                if type(item) is not Element:
+                    return None
+                return element_rows.get(item)
+
+            def _index(self, value, start=0, stop=None):
+                row = _row_of(value)
+                if row is None or row not in range(n_elements)[start:stop]:
+                    raise ValueError("tuple.index(x): x not in tuple")
+                return row
+
+            def _count(self, value):
+                return int(_row_of(value) is not None)
+
+            def _eq(self, other):
+                if self is other:
+                    return True
+                if not isinstance(other, tuple):
+                    return NotImplemented
+                return tuple(_iter(self)) == tuple(other)
+
+            def _ne(self, other):
+                equal = _eq(self, other)
+                return equal if equal is NotImplemented else not equal
+
+            def _hash(self):
+                return hash(tuple(_iter(self)))
 
-        Elements = Elements(*all_elements)
+            def _repr(self):
+                return f"Elements(n_elements={n_elements}, lazy=True)"
 
+            Elements.__getitem__ = _getitem
+            Elements.__iter__ = _iter
+            Elements.__contains__ = _contains
+            Elements.__eq__ = _eq
+            Elements.__ne__ = _ne
+            Elements.__hash__ = _hash
+            Elements.__repr__ = _repr
+            for name, method in (("index", _index), ("count", _count)):
+                if name not in Elements._fields:
+                    setattr(Elements, name, method)
+            Elements = Elements(*range(n_elements))
+        else:
+            Elements = Elements(*all_elements)
+
+        # strings and other keys search key_attr, e.g. Elements["H"]
+        index_element = ElementsClass.__getitem__
+
+        def _getitem_by_key(self, key):
+            if type(key) is str:
+                return accessors[key_attr](self, key)
+            if (
+                type(key) is int
+                or isinstance(key, slice)
+                or hasattr(type(key), "__index__")
+            ):
+                return index_element(self, key)
+            try:
+                return accessors[key_attr](self, key)
+            except InvalidElementError:
+                raise
+            except Exception as e:
+                # e.g. Elements[1.0], which the key_attr converter cannot handle
+                raise TypeError(
+                    f"Elements indices must be integers, slices "
+                    f"or {key_attr} values, not {type(key).__name__}"
+                ) from e
+
+        ElementsClass.__getitem__ = _getitem_by_key
+
+        refresh_instrumentation()
+        hooks._register(ElementsClass)
+        hooks._emit("container", start, size=n_elements)
         return Elements
 
     def __init__(
@@ -298,10 +1726,74 @@ class Elementable(type):
             "symbol": lambda x: x.capitalize()
         },
         element_cls: Type = NamedTuple,
-        json_file: str = resource_filename(__name__, "data/elements.json"),
+        json_file: str = DEFAULT_JSON_FILE,
         decimals: Optional[int] = 4,
+        key_attr: str = "symbol",
+        key_transform: Callable = lambda x: x if x != "*" else "X",
+        indexed: Optional[List[str]] = None,
+        schema: Optional[Dict[str, Type]] = None,
+        lazy: bool = False,
+        defer_units: bool = False,
+        data: Optional[List[Dict[str, Any]]] = None,
+        normalization_cache: Union[int, Dict[str, int], None] = None,
+        resolution: Optional[Dict[str, float]] = None,
+        result_cache: Optional[int] = None,
     ):
         pass  # pragma: no cover
 
+    @classmethod
+    def build_many(
+        cls,
+        configs: List[Dict[str, Any]],
+        max_workers: Optional[int] = None,
+    ) -> list:
+        """Build several element containers concurrently.
+
+        JSON files are read and parsed concurrently in a thread pool,
+        and each file is only parsed once even if it is used by
+        several configurations. The containers are then built
+        in the same pool.
+
+        Parameters
+        ----------
+            configs: List[Dict[str, Any]]
+                Keyword arguments for each call to :class:`Elementable`.
+            max_workers: int
+                The maximum number of threads to use.
+
+        Returns
+        -------
+            elements_containers: list
+                The built containers, in the same order as ``configs``.
+
+        Examples
+        --------
+        ::
+
+            elements, vegetables = Elementable.build_many([
+                {},
+                dict(json_file=VEGETABLES_JSON, key_attr="name"),
+            ])
+        """
+        configs = [dict(config) for config in configs]
+        paths = {}
+        for config in configs:
+            if config.get("data") is None:
+                json_file = config.pop("json_file", None)
+                if json_file is None:
+                    json_file = DEFAULT_JSON_FILE
+                path = os.path.abspath(str(json_file))
+                paths.setdefault(path, []).append(config)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for contents, path_configs in zip(
+                executor.map(_load_json, paths),
+                paths.values(),
+            ):
+                for config in path_configs:
+                    config["data"] = contents
+            futures = [executor.submit(cls, **config) for config in configs]
+            return [future.result() for future in futures]
+
 
 Elements = Elementable()
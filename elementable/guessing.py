@@ -0,0 +1,232 @@
+"""
+Guess elements from force field atom names and types, e.g. "CA", "HW1" or "CL-".
+"""
+
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+from .exceptions import InvalidElementError
+
+__all__ = ["ElementGuesser", "RESIDUE_ALIASES"]
+
+
+_TERMINAL = object()
+
+#: Atom names that are mapped to a symbol directly in specific residues,
+#: e.g. selenium in selenomethionine and selenocysteine
+RESIDUE_ALIASES = {
+    "MSE": {"SE": "Se"},
+    "SEC": {"SE": "Se"},
+}
+
+
+class ElementGuesser:
+    """Guess elements from atom names with a prefix trie over symbols.
+
+    Names are upper-cased, and leading digits (as in "1HB") and trailing
+    charges (as in "CL-") are removed. The symbols that the rest of the name
+    starts with are then found by walking a trie of the registered symbols.
+    Names in ``residue_aliases`` for the residue of the atom,
+    or in ``aliases``, are mapped to their symbol directly.
+    Otherwise, when several symbols match, e.g. C and Ca for "CA",
+    the following rules choose between them:
+
+    #. If the residue has the same name as the atom, as for ions
+       (atom "CA" in residue "CA"), or the name had a charge,
+       the longest symbol is chosen.
+    #. If the longest symbol is in ``two_letter``, e.g. Cl or Br,
+       it is chosen.
+    #. If the name starts with a letter in ``organic``,
+       the one-letter symbol is chosen, as the rest of the name is
+       usually a position (atom "CA" in residue "ALA", "HG1", "NE2", "OW").
+    #. Otherwise the longest symbol is chosen ("FE", "ZN", "MG").
+
+    Guesses are cached per unique name and residue,
+    so large systems only pay for each distinct atom once.
+
+    Parameters
+    ----------
+        elements: Elements
+            The element container. Defaults to the standard ``Elements``.
+        attr_name: str
+            The attribute with the symbols
+        organic: Iterable[str]
+            Symbols that names are assumed to start with
+            when they are ambiguous
+        two_letter: Iterable[str]
+            Symbols that are chosen over one-letter symbols
+            even when the name starts with an organic element
+        aliases: Dict[str, str]
+            Names (after removing digits and charges) that are mapped
+            to a symbol directly, e.g. ``{"OT": "O"}``
+        residue_aliases: Dict[str, Dict[str, str]]
+            Names that are mapped to a symbol directly in a residue,
+            e.g. ``{"MSE": {"SE": "Se"}}``. Defaults to
+            :data:`RESIDUE_ALIASES`, skipping symbols that are not
+            in the elements.
+
+    Examples
+    --------
+    ::
+
+        guesser = ElementGuesser()
+        guesser.guess("CA", residue="ALA")  # carbon
+        guesser.guess("CA", residue="CA")  # calcium
+        guesser.guess("HW1")  # hydrogen
+        guesser.guess("CL-")  # chlorine
+        guesser.guess("SE", residue="MSE")  # selenium
+    """
+
+    def __init__(
+        self,
+        elements=None,
+        attr_name: str = "symbol",
+        organic: Iterable[str] = ("H", "C", "N", "O", "P", "S"),
+        two_letter: Iterable[str] = ("Cl", "Br"),
+        aliases: Optional[Dict[str, str]] = None,
+        residue_aliases: Optional[Dict[str, Dict[str, str]]] = None,
+    ):
+        if elements is None:
+            from .elementable import Elements as elements
+        self.elements = elements
+        self.attr_name = attr_name
+        self.organic = {symbol.upper() for symbol in organic}
+        self.two_letter = {symbol.upper() for symbol in two_letter}
+        registry = getattr(elements.registry, attr_name)
+        self._symbols = {
+            str(symbol).upper(): element
+            for symbol, element in registry.items()
+            if str(symbol).isalpha()
+        }
+        self._aliases = {
+            name.upper(): self._symbols[symbol.upper()]
+            for name, symbol in (aliases or {}).items()
+        }
+        if residue_aliases is None:
+            residue_aliases = {
+                residue: {
+                    name: symbol
+                    for name, symbol in names.items()
+                    if symbol.upper() in self._symbols
+                }
+                for residue, names in RESIDUE_ALIASES.items()
+            }
+        self._residue_aliases = {
+            residue.upper(): {
+                name.upper(): self._symbols[symbol.upper()]
+                for name, symbol in names.items()
+            }
+            for residue, names in residue_aliases.items()
+        }
+        self._trie = {}
+        for symbol in self._symbols:
+            node = self._trie
+            for character in symbol:
+                node = node.setdefault(character, {})
+            node[_TERMINAL] = symbol
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    def _matches(self, name: str) -> List[str]:
+        """Return the symbols that ``name`` starts with, shortest first"""
+        matches = []
+        node = self._trie
+        for character in name:
+            node = node.get(character)
+            if node is None:
+                break
+            if _TERMINAL in node:
+                matches.append(node[_TERMINAL])
+        return matches
+
+    def _guess(self, name: str, residue: Optional[str]) -> Any:
+        name = str(name).strip().upper()
+        stripped = name.rstrip("+-0123456789")
+        charged = stripped != name.rstrip("0123456789")
+        stripped = stripped.lstrip("0123456789")
+        if residue is not None:
+            residue = str(residue).strip().upper().rstrip("+-0123456789")
+            residue_aliases = self._residue_aliases.get(residue, {})
+            if stripped in residue_aliases:
+                return residue_aliases[stripped]
+        if stripped in self._aliases:
+            return self._aliases[stripped]
+        matches = self._matches(stripped)
+        if not matches:
+            return None
+        longest = matches[-1]
+        if (
+            len(matches) == 1
+            or charged
+            or residue == stripped
+            or longest in self.two_letter
+            or matches[0] not in self.organic
+        ):
+            return self._symbols[longest]
+        return self._symbols[matches[0]]
+
+    def guess(self, name: str, residue: Optional[str] = None, default=None) -> Any:
+        """Guess the element of an atom.
+
+        Parameters
+        ----------
+            name: str
+                The atom name or type, e.g. "CA"
+            residue: str
+                The residue name, e.g. "ALA"
+            default: Any
+                Returned if no element can be guessed
+
+        Returns
+        -------
+            element: Element
+        """
+        key = (name, residue)
+        try:
+            element = self._cache[key]
+        except KeyError:
+            element = self._guess(name, residue)
+            with self._lock:
+                self._cache[key] = element
+        return element if element is not None else default
+
+    def __call__(self, name: str, residue: Optional[str] = None) -> Any:
+        """Guess the element of an atom, or raise an ``InvalidElementError``"""
+        element = self.guess(name, residue)
+        if element is None:
+            raise InvalidElementError(f"for atom name {name!r}")
+        return element
+
+    def guess_many(
+        self,
+        names: Iterable[str],
+        residues: Optional[Iterable[str]] = None,
+        default=None,
+    ) -> List[Any]:
+        """Guess the element of each atom.
+
+        Parameters
+        ----------
+            names: Iterable[str]
+                The atom names or types
+            residues: Iterable[str]
+                The residue name of each atom
+            default: Any
+                Used for atoms where no element can be guessed
+
+        Returns
+        -------
+            elements: List[Element]
+        """
+        names = list(names)
+        if residues is None:
+            residues = [None] * len(names)
+        return [
+            self.guess(name, residue, default)
+            for name, residue in zip(names, residues)
+        ]
+
+    def clear_cache(self):
+        """Forget all cached guesses"""
+        with self._lock:
+            self._cache.clear()
@@ -0,0 +1,77 @@
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Any, Callable, NamedTuple, Optional
+from weakref import WeakSet
+
+__all__ = ["TraceEvent", "set_tracer", "get_tracer", "tracing"]
+
+
+class TraceEvent(NamedTuple):
+    """A structured event emitted while building or querying elements.
+
+    Build events are "load", "types", "elements", "registry" and "container".
+    Query events are "lookup" (one attribute) and "query" (several attributes).
+    The key of a "lookup" is the normalized value, and the key of a "query"
+    the sorted ``(attribute, normalized value)`` pairs, with the attributes
+    joined by commas as its ``attribute``.
+    """
+    event: str
+    duration: float
+    attribute: Optional[str] = None
+    key: Any = None
+    size: Optional[int] = None
+
+
+_tracer: Optional[Callable[[TraceEvent], Any]] = None
+_containers = WeakSet()
+
+
+def set_tracer(tracer: Optional[Callable[[TraceEvent], Any]]):
+    """Set a function that is called with a :class:`TraceEvent`
+    for every build stage and query of every element container.
+
+    Parameters
+    ----------
+        tracer: Callable
+            A function taking a single ``TraceEvent``.
+            If ``None``, tracing is turned off.
+    """
+    global _tracer
+    _tracer = tracer
+    for container in list(_containers):
+        container._refresh_instrumentation()
+
+
+def get_tracer() -> Optional[Callable[[TraceEvent], Any]]:
+    """Return the current tracer, or ``None``"""
+    return _tracer
+
+
+@contextmanager
+def tracing(tracer: Callable[[TraceEvent], Any]):
+    """Set a tracer within a ``with`` block.
+
+    Examples
+    --------
+    ::
+
+        events = []
+        with tracing(events.append):
+            Elements(symbol="H")
+    """
+    previous = get_tracer()
+    set_tracer(tracer)
+    try:
+        yield tracer
+    finally:
+        set_tracer(previous)
+
+
+def _register(container_class):
+    _containers.add(container_class)
+
+
+def _emit(event: str, start: float, **kwargs):
+    tracer = _tracer
+    if tracer is not None:
+        tracer(TraceEvent(event, perf_counter() - start, **kwargs))
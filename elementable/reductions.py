@@ -0,0 +1,209 @@
+"""
+Mass-weighted reductions over coordinates, per group of atoms.
+
+Groups are integer labels for each atom, e.g. residue or molecule indices,
+and sums over groups use :func:`numpy.bincount`.
+Coordinates can be a single frame of shape ``(n_atoms, 3)``,
+an array of frames of shape ``(n_frames, n_atoms, 3)``,
+or an iterator of frames, e.g. from a trajectory reader.
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .arrays import column_array
+from .exceptions import ElementableError
+
+__all__ = ["total_mass", "center_of_mass", "radius_of_gyration"]
+
+
+def _atom_masses(elements, element_rows) -> np.ndarray:
+    rows = np.asarray(element_rows, dtype=np.intp)
+    if rows.ndim != 1:
+        raise ElementableError("element_rows must have shape (n_atoms,)")
+    if len(rows) and (rows.min() < 0 or rows.max() >= elements.n_elements):
+        raise ElementableError("element_rows must be rows of the elements")
+    return column_array(elements, "mass")[rows]
+
+
+def _group_labels(
+    groups,
+    n_atoms: int,
+    n_groups: Optional[int],
+) -> Tuple[np.ndarray, int]:
+    if groups is None:
+        return np.zeros(n_atoms, dtype=np.intp), 1
+    groups = np.asarray(groups, dtype=np.intp)
+    if groups.shape != (n_atoms,):
+        raise ElementableError("groups must have shape (n_atoms,)")
+    if n_atoms and groups.min() < 0:
+        raise ElementableError("groups must be non-negative")
+    if n_groups is None:
+        n_groups = int(groups.max()) + 1 if n_atoms else 0
+    return groups, n_groups
+
+
+def _group_sums(values: np.ndarray, groups: np.ndarray, n_groups: int) -> np.ndarray:
+    """Sum ``(n_frames, n_atoms, ...)`` values into ``(n_frames, n_groups, ...)``"""
+    n_frames, n_atoms = values.shape[:2]
+    trailing = values.shape[2:]
+    labels = (np.arange(n_frames)[:, np.newaxis] * n_groups + groups).ravel()
+    values = values.reshape(n_frames * n_atoms, int(np.prod(trailing)))
+    sums = np.stack(
+        [
+            np.bincount(labels, weights=values[:, k], minlength=n_frames * n_groups)
+            for k in range(values.shape[1])
+        ],
+        axis=-1,
+    )
+    return sums.reshape((n_frames, n_groups) + trailing)
+
+
+def _reduce_frames(function, frames, n_atoms: int) -> np.ndarray:
+    """Apply ``function`` to ``(n_frames, n_atoms, 3)`` coordinates.
+
+    Single frames lose their frame axis again,
+    and iterators are reduced one frame at a time.
+    Empty iterators give an empty frame axis.
+    """
+    if isinstance(frames, np.ndarray) or hasattr(frames, "__len__"):
+        frames = np.asarray(frames, dtype=float)
+        if frames.shape == (n_atoms, 3):
+            return function(frames[np.newaxis])[0]
+        if frames.ndim != 3 or frames.shape[1:] != (n_atoms, 3):
+            raise ElementableError(
+                "frames must have shape (n_atoms, 3) or (n_frames, n_atoms, 3)"
+            )
+        return function(frames)
+    results = [_reduce_frames(function, frame, n_atoms) for frame in frames]
+    if not results:
+        return function(np.empty((0, n_atoms, 3)))
+    return np.stack(results)
+
+
+def total_mass(
+    elements,
+    element_rows,
+    groups=None,
+    n_groups: Optional[int] = None,
+):
+    """Sum the masses of atoms, per group.
+
+    Parameters
+    ----------
+        elements: Elements
+            The element container
+        element_rows: numpy.ndarray
+            The row of the element of each atom, shape ``(n_atoms,)``
+        groups: numpy.ndarray
+            The group of each atom, shape ``(n_atoms,)``.
+            If not given, all atoms are one group.
+        n_groups: int
+            The number of groups. Defaults to the largest group plus one.
+
+    Returns
+    -------
+        mass: float or numpy.ndarray
+            The total mass, or an array of shape ``(n_groups,)``
+            if ``groups`` is given. Masses are bare magnitudes
+            in the units of the elements.
+    """
+    masses = _atom_masses(elements, element_rows)
+    labels, n = _group_labels(groups, len(masses), n_groups)
+    totals = np.bincount(labels, weights=masses, minlength=n)
+    return totals if groups is not None else float(totals[0])
+
+
+def center_of_mass(
+    elements,
+    element_rows,
+    frames,
+    groups=None,
+    n_groups: Optional[int] = None,
+) -> np.ndarray:
+    """Compute the center of mass of atoms, per group and frame.
+
+    Parameters
+    ----------
+        elements: Elements
+            The element container
+        element_rows: numpy.ndarray
+            The row of the element of each atom, shape ``(n_atoms,)``
+        frames: numpy.ndarray or Iterable
+            The coordinates of the atoms
+        groups: numpy.ndarray
+            The group of each atom, shape ``(n_atoms,)``.
+            If not given, all atoms are one group.
+        n_groups: int
+            The number of groups. Defaults to the largest group plus one.
+
+    Returns
+    -------
+        centers: numpy.ndarray
+            An array of shape ``([n_frames,] [n_groups,] 3)``.
+            The frame axis is only present for several frames,
+            and the group axis only if ``groups`` is given.
+            Empty groups are NaN.
+    """
+    masses = _atom_masses(elements, element_rows)
+    labels, n = _group_labels(groups, len(masses), n_groups)
+    totals = np.bincount(labels, weights=masses, minlength=n)
+
+    def reduce(coordinates):
+        weighted = _group_sums(coordinates * masses[:, np.newaxis], labels, n)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            centers = weighted / totals[:, np.newaxis]
+        return centers if groups is not None else centers[:, 0]
+
+    return _reduce_frames(reduce, frames, len(masses))
+
+
+def radius_of_gyration(
+    elements,
+    element_rows,
+    frames,
+    groups=None,
+    n_groups: Optional[int] = None,
+) -> np.ndarray:
+    """Compute the mass-weighted radius of gyration, per group and frame.
+
+    Coordinates are used as given, so molecules should not be
+    split across periodic boundaries.
+
+    Parameters
+    ----------
+        elements: Elements
+            The element container
+        element_rows: numpy.ndarray
+            The row of the element of each atom, shape ``(n_atoms,)``
+        frames: numpy.ndarray or Iterable
+            The coordinates of the atoms
+        groups: numpy.ndarray
+            The group of each atom, shape ``(n_atoms,)``.
+            If not given, all atoms are one group.
+        n_groups: int
+            The number of groups. Defaults to the largest group plus one.
+
+    Returns
+    -------
+        radii: numpy.ndarray
+            An array of shape ``([n_frames,] [n_groups])``.
+            The frame axis is only present for several frames,
+            and the group axis only if ``groups`` is given.
+            Empty groups are NaN.
+    """
+    masses = _atom_masses(elements, element_rows)
+    labels, n = _group_labels(groups, len(masses), n_groups)
+    totals = np.bincount(labels, weights=masses, minlength=n)
+
+    def reduce(coordinates):
+        weighted = _group_sums(coordinates * masses[:, np.newaxis], labels, n)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            centers = weighted / totals[:, np.newaxis]
+            offsets = coordinates - centers[:, labels]
+            squared = np.einsum("fij,fij->fi", offsets, offsets) * masses
+            radii = np.sqrt(_group_sums(squared, labels, n) / totals)
+        return radii if groups is not None else radii[:, 0]
+
+    return _reduce_frames(reduce, frames, len(masses))
@@ -0,0 +1,173 @@
+"""
+Case-insensitive prefix, substring and fuzzy search over string attributes.
+"""
+
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from typing import FrozenSet, Iterable, List, Optional, Tuple
+
+from .exceptions import ElementableError
+
+__all__ = ["StringIndex", "levenshtein"]
+
+
+def _fold_values(values: Iterable[Optional[str]]) -> dict:
+    """Return a dictionary of row to case-folded value, skipping ``None``"""
+    folded = {}
+    for row, value in enumerate(values):
+        if value is None:
+            continue
+        if not isinstance(value, str):
+            raise ElementableError(
+                f"Cannot index non-string value {value!r}"
+            )
+        folded[row] = value.casefold()
+    return folded
+
+
+def levenshtein(a: str, b: str, max_distance: Optional[int] = None) -> int:
+    """Return the edit distance between two strings.
+
+    If ``max_distance`` is given, only edits along the diagonal band
+    of that width are considered and the computation stops as soon as
+    the distance must exceed it, in which case ``max_distance + 1``
+    is returned.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if max_distance is None:
+        max_distance = len(a)
+    elif len(a) - len(b) > max_distance:
+        return max_distance + 1
+    too_far = max_distance + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        low = max(1, i - max_distance)
+        high = min(len(b), i + max_distance)
+        current = [too_far] * (len(b) + 1)
+        if low == 1:
+            current[0] = i
+        for j in range(low, high + 1):
+            current[j] = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != b[j - 1]),
+            )
+        if min(current[low - 1:high + 1]) > max_distance:
+            return too_far
+        previous = current
+    return min(previous[-1], too_far)
+
+
+class StringIndex:
+    """An index of string values for prefix, substring and fuzzy searches.
+
+    Prefixes are found by bisecting a sorted array of the values.
+    Substrings are found from an inverted index of the n-grams
+    of each value: a substring of at most ``n`` characters is looked
+    up directly, and longer substrings are only checked against
+    the values that contain all of their n-grams.
+    Fuzzy searches only compute the edit distance to values of a
+    similar length that share enough n-grams with the query.
+    Searches are case-insensitive.
+
+    Parameters
+    ----------
+        values: Iterable[Optional[str]]
+            The value of each row. ``None`` values are skipped.
+        n: int
+            The longest n-gram to index
+    """
+
+    def __init__(self, values: Iterable[Optional[str]], n: int = 3):
+        self.n = n
+        folded = _fold_values(values)
+        self._values = folded
+
+        entries = sorted((value, row) for row, value in folded.items())
+        self._sorted_values = [value for value, _ in entries]
+        self._sorted_rows = [row for _, row in entries]
+
+        rows_by_length = defaultdict(list)
+        grams = defaultdict(set)
+        for row, value in folded.items():
+            rows_by_length[len(value)].append(row)
+            for size in range(1, n + 1):
+                for start in range(len(value) - size + 1):
+                    grams[value[start:start + size]].add(row)
+        self._grams = {gram: frozenset(rows) for gram, rows in grams.items()}
+        self._rows_by_length = dict(rows_by_length)
+
+    def __len__(self):
+        return len(self._values)
+
+    def prefix(self, prefix: str) -> FrozenSet[int]:
+        """Return the rows of values that start with ``prefix``"""
+        prefix = prefix.casefold()
+        start = bisect_left(self._sorted_values, prefix)
+        end = bisect_left(self._sorted_values, prefix + chr(0x10FFFF), lo=start)
+        return frozenset(self._sorted_rows[start:end])
+
+    def contains(self, substring: str) -> FrozenSet[int]:
+        """Return the rows of values that contain ``substring``"""
+        substring = substring.casefold()
+        if not substring:
+            return frozenset(self._values)
+        if len(substring) <= self.n:
+            return self._grams.get(substring, frozenset())
+        gram_rows = sorted(
+            (
+                self._grams.get(substring[start:start + self.n], frozenset())
+                for start in range(len(substring) - self.n + 1)
+            ),
+            key=len,
+        )
+        candidates = gram_rows[0].intersection(*gram_rows[1:])
+        return frozenset(
+            row for row in candidates if substring in self._values[row]
+        )
+
+    def fuzzy(self, query: str, max_distance: int = 2) -> List[Tuple[int, int]]:
+        """Find the values within ``max_distance`` edits of ``query``.
+
+        Each edit changes at most ``size`` of the n-grams of that size
+        in the query, so a match must contain at least
+        ``len(query) - size + 1 - max_distance * size`` of them.
+        The largest n-gram size for which this is positive
+        is used to choose candidates; for short queries, candidates
+        are all values with a length within ``max_distance`` of the query.
+
+        Returns
+        -------
+            matches: List[Tuple[int, int]]
+                The ``(distance, row)`` of each match, closest first
+        """
+        query = query.casefold()
+        lengths = range(
+            max(len(query) - max_distance, 0),
+            len(query) + max_distance + 1,
+        )
+        for size in range(min(self.n, len(query)), 0, -1):
+            threshold = len(query) - size + 1 - max_distance * size
+            if threshold > 0:
+                counts = Counter()
+                for start in range(len(query) - size + 1):
+                    counts.update(self._grams.get(query[start:start + size], ()))
+                candidates = [
+                    row for row, count in counts.items()
+                    if count >= threshold and len(self._values[row]) in lengths
+                ]
+                break
+        else:
+            candidates = [
+                row
+                for length in lengths
+                for row in self._rows_by_length.get(length, ())
+            ]
+
+        matches = []
+        for row in candidates:
+            distance = levenshtein(query, self._values[row], max_distance)
+            if distance <= max_distance:
+                matches.append((distance, row))
+        return sorted(matches)
@@ -0,0 +1,104 @@
+from collections import defaultdict, deque
+import threading
+from typing import Any, Dict, Sequence
+
+__all__ = ["LookupStats"]
+
+
+class LatencyStats:
+    """Counts and latencies for one kind of lookup.
+
+    Parameters
+    ----------
+        n_samples: int
+            The number of most recent durations kept to estimate percentiles.
+    """
+
+    def __init__(self, n_samples: int = 10000):
+        self.lookups = 0
+        self.hits = 0
+        self.misses = 0
+        self.total_time = 0.0
+        self.samples = deque(maxlen=n_samples)
+
+    def record(self, duration: float, hit: bool = True):
+        self.lookups += 1
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+        self.total_time += duration
+        self.samples.append(duration)
+
+    def summary(self, percentiles: Sequence[float]) -> Dict[str, Any]:
+        summary = {
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "misses": self.misses,
+            "total_time": self.total_time,
+            "mean_time": self.total_time / self.lookups if self.lookups else 0.0,
+        }
+        samples = sorted(self.samples)
+        for percentile in percentiles:
+            if samples:
+                index = round(percentile / 100 * (len(samples) - 1))
+                value = samples[index]
+            else:
+                value = 0.0
+            summary[f"p{percentile:g}"] = value
+        return summary
+
+
+class LookupStats:
+    """Thread-safe lookup counters and latencies of an element container.
+
+    Single-attribute lookups are recorded per attribute,
+    including the lookups made for each attribute of a
+    multi-attribute query. Multi-attribute queries are
+    additionally recorded as a whole.
+
+    Parameters
+    ----------
+        n_samples: int
+            The number of most recent durations kept per attribute
+            to estimate percentiles.
+    """
+
+    percentiles = (50, 90, 99)
+
+    def __init__(self, n_samples: int = 10000):
+        self.n_samples = n_samples
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Clear all counters and latencies"""
+        with self._lock:
+            self._attributes = defaultdict(
+                lambda: LatencyStats(self.n_samples)
+            )
+            self._multiple = LatencyStats(self.n_samples)
+
+    def record(self, attr_name: str, duration: float, hit: bool = True):
+        """Record a lookup on one attribute"""
+        with self._lock:
+            self._attributes[attr_name].record(duration, hit)
+
+    def record_multiple(self, duration: float, hit: bool = True):
+        """Record a query on several attributes"""
+        with self._lock:
+            self._multiple.record(duration, hit)
+
+    def summary(self) -> Dict[str, Any]:
+        """Return the recorded statistics as a dictionary.
+
+        Times are in seconds.
+        """
+        with self._lock:
+            return {
+                "attributes": {
+                    attr_name: stats.summary(self.percentiles)
+                    for attr_name, stats in sorted(self._attributes.items())
+                },
+                "multiple": self._multiple.summary(self.percentiles),
+            }
@@ -1,3 +1,4 @@
+import operator
 
 import pytest
 from hypothesis import given, strategies as st
@@ -70,3 +71,86 @@ class BaseTestElementable:
     def test_get_none(self):
         with pytest.raises(InvalidElementError):
             self.element_class(group=None)
+
+    def test_get(self):
+        assert self.element_class.get(symbol="h") is self.element_class.H
+        assert self.element_class.get(symbol="Qq") is None
+        assert self.element_class.get(default=0, atomic_number=-1) == 0
+        assert self.element_class.get(symbol=3) is None
+        assert self.element_class.get(period=5, group=13) == (
+            self.element_class.In,
+        )
+        assert self.element_class.get(period=111, group=1) is None
+
+    def test_get_invalid_attribute(self):
+        with pytest.raises(ElementableError):
+            self.element_class.get(parsnip=3)
+
+    def test_validate(self):
+        symbols = ["H", "he", "Qq", 3, None, "H", ["H"]]
+        mask = self.element_class.validate("symbol", symbols)
+        assert mask == [True, True, False, False, False, True, False]
+
+    def test_row(self):
+        oxygen = self.element_class.O
+        assert oxygen.row == 8
+        assert operator.index(oxygen) == 8
+        assert self.element_class[oxygen] is oxygen
+        assert self.element_class.column("symbol")[oxygen] == "O"
+        assert list(range(10))[oxygen] == 8
+
+    def test_rows_of(self):
+        np = pytest.importorskip("numpy")
+        elements = self.element_class
+        atoms = [elements.O, elements.H, elements.H, elements.C]
+        rows = elements.rows_of(atoms)
+        assert rows.dtype == np.intp
+        assert list(rows) == [8, 1, 1, 6]
+        assert list(elements.rows_of(iter(atoms[:2]))) == [8, 1]
+        assert list(np.bincount(rows, minlength=9)[[1, 6, 8]]) == [2, 1, 1]
+        numbers = np.array(elements.column("atomic_number"))
+        assert list(numbers[rows]) == [8, 1, 1, 6]
+        assert list(elements.rows_of([elements.H, "H", None])) == [1, -1, -1]
+        assert len(elements.rows_of([])) == 0
+
+    def test_hash_and_equality(self):
+        h = self.element_class.H
+        o = self.element_class.O
+        assert h == self.element_class(symbol="H")
+        assert h != o
+        assert len({h, o, self.element_class(atomic_number=1)}) == 2
+        counts = {h: 2, o: 1}
+        assert counts[self.element_class.registry.name["hydrogen"]] == 2
+        assert h.value_equals(h)
+        assert not h.value_equals(o)
+        with pytest.raises(TypeError):
+            sorted([o, h])
+        assert sorted([o, h], key=lambda el: el.row) == [h, o]
+
+    def test_accessors(self):
+        elements = self.element_class
+        assert elements.by_symbol("h") is elements.H
+        assert elements.by_name("OXYGEN") is elements.O
+        assert elements.by_atomic_number(8) is elements.O
+        assert elements.by_period(1) == (elements.H, elements.He)
+        assert elements.by_mass(elements(symbol="C").mass) is elements.C
+        with pytest.raises(InvalidElementError, match="symbol=Qq"):
+            elements.by_symbol("Qq")
+        with pytest.raises(InvalidElementError):
+            elements.by_atomic_number(-1)
+
+    def test_getitem(self):
+        elements = self.element_class
+        assert elements["H"] is elements.H
+        assert elements["h"] is elements.H
+        assert elements[1] is elements.H
+        assert elements[-1] is elements(atomic_number=117)
+        assert elements[1:3] == (elements.H, elements.He)
+        with pytest.raises(InvalidElementError):
+            elements["Qq"]
+        with pytest.raises(IndexError):
+            elements[500]
+        with pytest.raises(TypeError, match="not float"):
+            elements[1.0]
+        with pytest.raises(TypeError, match="not NoneType"):
+            elements[None]
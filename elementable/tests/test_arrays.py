@@ -0,0 +1,135 @@
+import pytest
+
+from elementable import Elements, Elementable
+from elementable.exceptions import ElementableError
+
+np = pytest.importorskip("numpy")
+arrays = pytest.importorskip("elementable.arrays")
+
+
+@pytest.fixture(scope="module")
+def quantized():
+    return Elementable(resolution=dict(mass=1e-4, covalent_radius=0.01))
+
+
+class TestPairwise:
+
+    def test_bond_cutoffs(self):
+        cutoffs = Elements.pairwise("covalent_radius", tolerance=0.45)
+        assert cutoffs.shape == (Elements.n_elements, Elements.n_elements)
+        c, h = Elements.C, Elements.H
+        expected = c.covalent_radius + h.covalent_radius + 0.45
+        assert cutoffs[c, h] == pytest.approx(expected)
+        assert cutoffs[h, c] == pytest.approx(expected)
+
+        rows = np.array([6, 6, 1])
+        np.testing.assert_allclose(
+            cutoffs[rows[:-1], rows[1:]],
+            [0.76 * 2 + 0.45, expected],
+        )
+
+    def test_nan(self):
+        cutoffs = Elements.pairwise("covalent_radius")
+        assert np.isnan(cutoffs[0, 1])
+        assert np.isnan(cutoffs[1, 0])
+        assert not np.isnan(cutoffs[1, 1])
+
+    def test_cached_read_only(self):
+        cutoffs = Elements.pairwise("covalent_radius", tolerance=0.45)
+        assert Elements.pairwise("covalent_radius", tolerance=0.45) is cutoffs
+        with pytest.raises(ValueError):
+            cutoffs[1, 1] = 0
+
+    def test_function_not_cached(self):
+        def double(a, b):
+            return (a + b) * 2
+
+        cutoffs = Elements.pairwise("covalent_radius", op=double)
+        assert cutoffs[1, 1] == pytest.approx(0.31 * 4)
+        assert Elements.pairwise("covalent_radius", op=double) is not cutoffs
+        with pytest.raises(ValueError):
+            cutoffs[1, 1] = 0
+
+    @pytest.mark.parametrize("op, expected", [
+        ("mean", (0.31 + 0.76) / 2),
+        ("geometric", (0.31 * 0.76) ** 0.5),
+        ("max", 0.76),
+        ("min", 0.31),
+        (lambda a, b: a * 2 + b, 0.31 * 2 + 0.76),
+    ])
+    def test_ops(self, op, expected):
+        matrix = Elements.pairwise("covalent_radius", op=op)
+        assert matrix[1, 6] == pytest.approx(expected)
+
+    def test_units(self):
+        units = pytest.importorskip("openff.units")
+        elements = Elementable(units=dict(mass=units.unit.amu))
+        masses = elements.pairwise("mass", op="product")
+        assert masses[1, 1] == pytest.approx(1.00782503223 ** 2)
+
+    @pytest.mark.parametrize("attr_name, op, match", [
+        ("symbol", "sum", "not a numeric attribute"),
+        ("mass", "parsnip", "Unknown pairwise operation"),
+        ("parsnip", "sum", "not supported"),
+    ])
+    def test_invalid(self, attr_name, op, match):
+        with pytest.raises(ElementableError, match=match):
+            Elements.pairwise(attr_name, op=op)
+
+
+class TestRowsArray:
+
+    def test_dense(self):
+        values = np.array([[1, 8], [-1, 200]])
+        np.testing.assert_array_equal(
+            Elements.rows_array("atomic_number", values),
+            [[1, 8], [-1, -1]],
+        )
+
+    def test_float(self):
+        values = np.array([6.0, 6.5, np.nan, np.inf, -6.0])
+        np.testing.assert_array_equal(
+            Elements.rows_array("atomic_number", values),
+            [6, -1, -1, -1, -1],
+        )
+
+    def test_not_dense(self):
+        np.testing.assert_array_equal(
+            Elements.rows_array("symbol", ["C", "h", "Parsnip"]),
+            [6, 1, -1],
+        )
+
+    def test_not_unique(self):
+        with pytest.raises(ElementableError, match="unique"):
+            Elements.rows_array("period", [1])
+
+
+class TestQuantizedRowsArray:
+
+    def test_search(self, quantized):
+        masses = np.array([[1.00783, 12.0], [12.0001, np.nan]])
+        rows = quantized.rows_array("mass", masses)
+        np.testing.assert_array_equal(rows, [[1, 6], [-1, -1]])
+        expected = quantized.rows("mass", masses.ravel().tolist())
+        np.testing.assert_array_equal(rows.ravel(), expected)
+
+    def test_matches_scalar(self, quantized):
+        masses = np.array(quantized.column("mass"))[1:]
+        masses = masses + np.random.default_rng(3).uniform(-1e-4, 1e-4, len(masses))
+        np.testing.assert_array_equal(
+            quantized.rows_array("mass", masses),
+            quantized.rows("mass", masses.tolist()),
+        )
+
+    def test_not_unique(self, quantized):
+        with pytest.raises(ElementableError, match="unique"):
+            quantized.rows_array("covalent_radius", [0.31])
+
+    def test_search_rows(self):
+        keys, rows = arrays.sorted_row_table({30: 2, 10: 0, 20: 1})
+        np.testing.assert_array_equal(
+            arrays.search_rows(keys, rows, [10, 25, 30, 40, 0, 20.0, 20.5]),
+            [0, -1, 2, -1, -1, 1, -1],
+        )
+        empty = arrays.sorted_row_table({})
+        np.testing.assert_array_equal(arrays.search_rows(*empty, [1]), [-1])
@@ -0,0 +1,119 @@
+import itertools
+
+import pytest
+
+from elementable import Elements
+from elementable.exceptions import ElementableError
+
+np = pytest.importorskip("numpy")
+
+
+def brute_force_bonds(rows, coordinates, box=None, tolerance=0.45, min_distance=0.1):
+    cutoffs = Elements.pairwise("covalent_radius", tolerance=tolerance)
+    bonds = []
+    for i, j in itertools.combinations(range(len(rows)), 2):
+        vector = coordinates[j] - coordinates[i]
+        if box is not None:
+            vector -= box * np.round(vector / box)
+        distance = np.linalg.norm(vector)
+        if min_distance < distance <= cutoffs[rows[i], rows[j]]:
+            bonds.append((i, j))
+    return np.array(bonds, dtype=np.intp).reshape(-1, 2)
+
+
+@pytest.fixture
+def water():
+    rows = np.array([8, 1, 1])
+    coordinates = np.array([
+        [0.0, 0.0, 0.0],
+        [0.9572, 0.0, 0.0],
+        [-0.2400, 0.9266, 0.0],
+    ])
+    return rows, coordinates
+
+
+@pytest.fixture
+def random_system():
+    rng = np.random.default_rng(42)
+    n_atoms = 400
+    rows = rng.choice([1, 6, 7, 8, 16], size=n_atoms)
+    coordinates = rng.uniform(0, 12, size=(n_atoms, 3))
+    return rows, coordinates
+
+
+class TestPerceiveBonds:
+
+    def test_water(self, water):
+        bonds, distances = Elements.perceive_bonds(*water, return_distances=True)
+        np.testing.assert_array_equal(bonds, [[0, 1], [0, 2]])
+        np.testing.assert_allclose(distances, [0.9572, 0.9572], atol=1e-4)
+
+    def test_distant_molecules(self, water):
+        rows, coordinates = water
+        rows = np.concatenate([rows, rows])
+        coordinates = np.concatenate([coordinates, coordinates + 1000])
+        bonds = Elements.perceive_bonds(rows, coordinates)
+        np.testing.assert_array_equal(bonds, [[0, 1], [0, 2], [3, 4], [3, 5]])
+
+    def test_far_away_atom(self, water):
+        rows, coordinates = water
+        rows = np.append(rows, 6)
+        coordinates = np.concatenate([coordinates, [[1e7, 1e7, 1e7]]])
+        bonds = Elements.perceive_bonds(rows, coordinates)
+        np.testing.assert_array_equal(bonds, [[0, 1], [0, 2]])
+
+    def test_sparse_matches_brute_force(self, random_system):
+        rows, coordinates = random_system
+        # clusters far apart, so only the occupied cells are numbered
+        shifts = np.array([[0, 0, 0], [1e4, -1e5, 3e6], [-1e8, 0, 1e8]])
+        shifts = np.repeat(shifts, [150, 150, 100], axis=0)
+        coordinates = coordinates + shifts
+        bonds = Elements.perceive_bonds(rows, coordinates, chunk_size=64)
+        np.testing.assert_array_equal(bonds, brute_force_bonds(rows, coordinates))
+        assert len(bonds)
+
+    def test_empty(self):
+        bonds = Elements.perceive_bonds([], np.empty((0, 3)))
+        assert bonds.shape == (0, 2)
+
+    @pytest.mark.parametrize("max_workers, chunk_size", [(1, 65536), (4, 37)])
+    def test_matches_brute_force(self, random_system, max_workers, chunk_size):
+        rows, coordinates = random_system
+        bonds = Elements.perceive_bonds(
+            rows,
+            coordinates,
+            max_workers=max_workers,
+            chunk_size=chunk_size,
+        )
+        assert len(bonds)
+        np.testing.assert_array_equal(bonds, brute_force_bonds(rows, coordinates))
+
+    @pytest.mark.parametrize("box", [[12, 12, 12], [12, 6, 7]])
+    def test_periodic_matches_brute_force(self, random_system, box):
+        rows, coordinates = random_system
+        box = np.array(box, dtype=float)
+        bonds = Elements.perceive_bonds(rows, coordinates, box=box, chunk_size=50)
+        expected = brute_force_bonds(rows, coordinates, box=box)
+        np.testing.assert_array_equal(bonds, expected)
+
+    def test_periodic_bond_across_boundary(self):
+        rows = np.array([6, 1])
+        coordinates = np.array([[0.2, 5.0, 5.0], [9.3, 5.0, 5.0]])
+        assert len(Elements.perceive_bonds(rows, coordinates)) == 0
+        bonds = Elements.perceive_bonds(rows, coordinates, box=[10, 10, 10])
+        np.testing.assert_array_equal(bonds, [[0, 1]])
+
+    def test_missing_radius(self):
+        rows = np.array([0, 1])
+        coordinates = np.array([[0.0, 0.0, 0.0], [0.5, 0.0, 0.0]])
+        assert len(Elements.perceive_bonds(rows, coordinates)) == 0
+
+    @pytest.mark.parametrize("rows, coordinates, box, match", [
+        ([1, 1], np.zeros((3, 3)), None, "must have shape"),
+        ([1, 500], np.zeros((2, 3)), None, "rows of the elements"),
+        ([1, 1], np.zeros((2, 3)), [10, 10], "orthorhombic"),
+        ([1, 1], np.zeros((2, 3)), [2, 2, 2], "half the shortest box length"),
+    ])
+    def test_invalid(self, rows, coordinates, box, match):
+        with pytest.raises(ElementableError, match=match):
+            Elements.perceive_bonds(rows, coordinates, box=box)
@@ -0,0 +1,232 @@
+import pytest
+
+from elementable import Elements, Elementable
+from elementable.cache import LRUCache, NormalizationCache
+from elementable.exceptions import ElementableError, InvalidElementError
+
+
+class CountingConverter:
+
+    def __init__(self, convert):
+        self.convert = convert
+        self.calls = 0
+
+    def __call__(self, value):
+        self.calls += 1
+        return self.convert(value)
+
+
+@pytest.fixture
+def converter():
+    return CountingConverter(lambda x: "".join(x).capitalize())
+
+
+@pytest.fixture
+def elements(converter):
+    elements = Elementable(
+        converters=dict(symbol=converter, name=lambda x: x.lower()),
+        normalization_cache=dict(symbol=2),
+    )
+    # only count the calls made by queries
+    converter.calls = 0
+    return elements
+
+
+class TestNormalizationCache:
+
+    def test_cache(self):
+        cache = NormalizationCache(lambda x: x * 2, maxsize=2)
+        assert cache(1) == 2
+        assert cache(1.0) == 2.0
+        assert type(cache(1.0)) is float
+        assert cache(1) == 2
+        assert cache(3) == 6
+        info = cache.info()
+        assert info["hits"] == 2
+        assert info["misses"] == 3
+        assert info["size"] == 2
+        assert info["evictions"] == 1
+        assert info["hit_rate"] == pytest.approx(0.4)
+
+    def test_bypass(self):
+        cache = NormalizationCache(len, maxsize=2)
+        assert cache([1, 2]) == 2
+        assert cache([1, 2]) == 2
+        assert cache.info()["bypasses"] == 2
+        assert cache.info()["size"] == 0
+
+    def test_failures_not_cached(self):
+        def lookup(x):
+            raise KeyError(x)
+
+        cache = NormalizationCache(lookup, maxsize=2)
+        for _ in range(2):
+            with pytest.raises(KeyError):
+                cache("a")
+        info = cache.info()
+        assert (info["misses"], info["size"], info["evictions"]) == (2, 0, 0)
+
+    def test_type_error_raised(self):
+        cache = NormalizationCache(lambda x: x + 1, maxsize=2)
+        with pytest.raises(TypeError):
+            cache("a")
+        assert cache.info()["bypasses"] == 0
+
+    def test_clear(self):
+        cache = NormalizationCache(str, maxsize=2)
+        cache(1)
+        cache.clear()
+        assert cache.info()["misses"] == 0
+        assert cache.info()["size"] == 0
+
+
+class TestElementsNormalizationCache:
+
+    def test_converter_skipped(self, elements, converter):
+        for lookup in (
+            lambda: elements(symbol="h"),
+            lambda: elements.by_symbol("h"),
+            lambda: elements["h"],
+        ):
+            assert lookup() is elements.H
+        assert converter.calls == 1
+        info = elements.cache_info()["normalization"]
+        assert list(info) == ["symbol"]
+        assert info["symbol"]["hits"] == 2
+
+    def test_eviction(self, elements, converter):
+        for symbol in ["h", "he", "li", "h"]:
+            elements(symbol=symbol)
+        assert converter.calls == 4
+        assert elements.cache_info()["normalization"]["symbol"]["evictions"] == 2
+
+    def test_unhashable(self, elements):
+        assert elements(symbol=["h", "e"]) is elements.He
+        assert elements.cache_info()["normalization"]["symbol"]["bypasses"] == 1
+
+    def test_invalid(self, elements, converter):
+        for _ in range(2):
+            with pytest.raises(InvalidElementError):
+                elements(symbol="qq")
+        assert converter.calls == 2
+
+    def test_multiple(self, elements, converter):
+        assert elements(symbol="h", name="hydrogen") == (elements.H,)
+        assert elements(symbol="h", name="helium") == ()
+        assert converter.calls == 1
+
+    def test_bypassed_when_instrumented(self, elements, converter):
+        elements(symbol="h")
+        elements.enable_stats()
+        elements(symbol="h")
+        elements.by_symbol("h")
+        assert converter.calls == 3
+        elements.enable_stats(False)
+        elements.by_symbol("h")
+        assert converter.calls == 3
+
+    def test_clear(self, elements, converter):
+        elements(symbol="h")
+        elements.clear_caches()
+        elements(symbol="h")
+        assert converter.calls == 2
+
+    def test_all_normalized_attributes(self):
+        elements = Elementable(normalization_cache=16)
+        assert sorted(elements.cache_info()["normalization"]) == [
+            "covalent_radius", "mass", "name", "symbol",
+        ]
+        assert elements(mass=1.00783) is elements.H
+        assert elements(mass=1.00783) is elements.H
+
+    def test_disabled_by_default(self):
+        assert Elements.cache_info()["normalization"] == {}
+
+    def test_invalid_attribute(self):
+        with pytest.raises(ElementableError, match="parsnip"):
+            Elementable(normalization_cache=dict(parsnip=2))
+
+
+class TestLRUCache:
+
+    def test_eviction(self):
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1
+        cache.put("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert len(cache) == 2
+        info = cache.info()
+        assert (info["hits"], info["misses"], info["evictions"]) == (3, 1, 1)
+        assert info["hit_rate"] == pytest.approx(0.75)
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.info()["hits"] == 0
+
+
+class TestResultCache:
+
+    @pytest.fixture
+    def elements(self):
+        return Elementable(result_cache=2)
+
+    def test_cached(self, elements):
+        iodine = elements(period=5, group=17)
+        assert iodine == (elements.I,)
+        assert elements(group=17, period=5) is iodine
+        assert elements(period=5.0, group=17) is iodine
+        info = elements.cache_info()["results"]
+        assert (info["hits"], info["misses"], info["size"]) == (2, 1, 1)
+
+    def test_normalized_query(self, elements):
+        carbon = elements(symbol="c", mass=12.00001)
+        assert carbon == (elements.C,)
+        assert elements(symbol="C", mass=12.0) is carbon
+        assert elements("carbon", "C") == (elements.C,)
+        assert elements.cache_info()["results"]["hits"] == 1
+
+    def test_empty_results(self, elements):
+        assert elements(period=111, group=1) == ()
+        assert elements(period=111, group=1) == ()
+        assert elements.cache_info()["results"]["hits"] == 1
+
+    def test_eviction(self, elements):
+        for period in [1, 2, 3, 1]:
+            elements(period=period, group=1)
+        info = elements.cache_info()["results"]
+        assert (info["misses"], info["evictions"]) == (4, 2)
+
+    def test_single_attribute_not_cached(self, elements):
+        elements(period=1)
+        assert elements.cache_info()["results"]["misses"] == 0
+
+    def test_invalid(self, elements):
+        with pytest.raises(ElementableError, match="parsnip"):
+            elements(period=1, parsnip=2)
+        with pytest.raises(AttributeError):
+            elements(symbol=1, period=1)
+        assert elements.cache_info()["results"]["size"] == 0
+
+    def test_bypassed_when_instrumented(self, elements):
+        elements.enable_stats()
+        elements(period=5, group=17)
+        elements(period=5, group=17)
+        assert elements.cache_info()["results"]["misses"] == 0
+        assert elements.stats()["multiple"]["lookups"] == 2
+
+    def test_clear(self, elements):
+        elements(period=5, group=17)
+        elements.clear_caches()
+        assert elements.cache_info()["results"]["size"] == 0
+
+    def test_tables_independent(self, elements):
+        other = Elementable(result_cache=2)
+        assert other(period=5, group=17)[0] is other.I
+        assert elements(period=5, group=17)[0] is elements.I
+        assert other.I is not elements.I
+
+    def test_disabled_by_default(self):
+        assert Elements.cache_info()["results"] is None
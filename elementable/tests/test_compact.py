@@ -0,0 +1,77 @@
+import copy
+import gc
+import json
+import sys
+import weakref
+
+import pytest
+
+from elementable import Elementable, Elements, CompactElement
+
+from .base import BaseTestElementable
+
+
+class TestCompactElementable(BaseTestElementable):
+
+    element_class = Elementable(element_cls=CompactElement)
+
+    def test_no_dict(self):
+        h = self.element_class.H
+        assert not hasattr(h, "__dict__")
+        assert sys.getsizeof(h) <= sys.getsizeof(Elements.H)
+
+    def test_not_sequence(self):
+        h = self.element_class.H
+        with pytest.raises(TypeError):
+            len(h)
+
+    def test_json(self):
+        h = self.element_class(atomic_number=1)
+        h_dict = {
+            "name": "hydrogen",
+            "symbol": "H",
+            "atomic_number": 1,
+            "mass": 1.00782503223,
+            "period": 1,
+            "group": 1,
+            "covalent_radius": 0.31
+        }
+        assert h.dict() == h_dict
+        assert json.loads(h.json()) == h_dict
+
+    def test_immutable(self):
+        with pytest.raises(AttributeError, match="immutable"):
+            self.element_class.H.mass = 3
+
+    def test_copy(self):
+        copied = copy.deepcopy(self.element_class.X)
+        assert copied.value_equals(self.element_class.X)
+        assert copied != self.element_class.X
+        assert not copied is self.element_class.X
+
+    def test_repr(self):
+        assert repr(self.element_class.H) == repr(Elements.H)
+
+
+class TestLazyCompactElementable(BaseTestElementable):
+
+    element_class = Elementable(element_cls=CompactElement, lazy=True)
+
+    def test_weak_cache(self):
+        ref = weakref.ref(self.element_class.Ts)
+        gc.collect()
+        assert ref() is None
+        h = self.element_class.H
+        assert self.element_class(atomic_number=1) is h
+
+
+def test_numpy_index():
+    np = pytest.importorskip("numpy")
+    elements = TestCompactElementable.element_class
+    sequence = [elements.H, elements.O, elements.H]
+    masses = np.array(elements.column("mass"))
+    assert masses[elements.O] == elements.O.mass
+    rows = np.array(sequence, dtype=int)
+    assert list(rows) == [1, 8, 1]
+    assert np.bincount(rows)[1] == 2
+    np.testing.assert_allclose(masses[rows], [el.mass for el in sequence])
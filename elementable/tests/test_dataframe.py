@@ -0,0 +1,165 @@
+import numpy as np
+import pytest
+
+from elementable import Elements, Elementable
+from elementable.exceptions import ElementableError
+
+from .datafiles import VEGETABLES_JSON
+
+pd = pytest.importorskip("pandas")
+dataframe = pytest.importorskip("elementable.dataframe")
+
+
+def test_to_frame():
+    frame = Elements.to_frame()
+    assert len(frame) == Elements.n_elements
+    assert list(frame.columns) == list(Elements.H._fields)
+    assert frame.loc[1, "symbol"] == "H"
+    assert frame.loc[8, "mass"] == Elements.O.mass
+    assert np.isnan(frame.loc[0, "covalent_radius"])
+    assert Elements.to_frame() is not frame
+
+
+def test_to_frame_copy():
+    elements = Elementable()
+    frame = elements.to_frame()
+    frame.loc[1, "mass"] = 999
+    assert elements.to_frame().loc[1, "mass"] == elements.H.mass
+    masses = pd.Series(["H"]).elements(elements).mass
+    assert list(masses) == [elements.H.mass]
+    atoms = pd.Series(["H"], dtype=dataframe.ElementDtype(elements))
+    assert list(atoms.array.attribute("mass")) == [elements.H.mass]
+    with pytest.raises(ValueError):
+        elements._attribute_values("mass")[1] = 999
+
+
+def test_to_frame_units():
+    units = pytest.importorskip("openff.units")
+    elements = Elementable(units=dict(mass=units.unit.amu))
+    frame = elements.to_frame()
+    assert frame["mass"].dtype == np.float64
+    assert frame.loc[1, "mass"] == 1.00782503223
+
+
+def test_symbols():
+    symbols = pd.Series(["C", "H", "h", "O", "Qq"], index=list("abcde"))
+    masses = symbols.elements.mass
+    assert list(masses.index) == list("abcde")
+    assert masses.name == "mass"
+    np.testing.assert_allclose(
+        masses[:4],
+        [Elements.C.mass, Elements.H.mass, Elements.H.mass, Elements.O.mass],
+    )
+    assert np.isnan(masses["e"])
+    assert list(symbols.elements.rows) == [6, 1, 1, 8, -1]
+
+
+def test_atomic_numbers():
+    numbers = pd.Series([1, 8, 8, 200])
+    names = numbers.elements.name
+    assert list(names[:3]) == ["hydrogen", "oxygen", "oxygen"]
+    assert pd.isna(names[3])
+    assert list(numbers.elements.atomic_number[:3]) == [1, 8, 8]
+
+
+def test_atomic_numbers_with_missing():
+    numbers = pd.Series([1.0, 6.0, np.nan])
+    assert numbers.elements.attr_name == "atomic_number"
+    masses = numbers.elements.mass
+    np.testing.assert_allclose(masses[:2], [Elements.H.mass, Elements.C.mass])
+    assert np.isnan(masses[2])
+    assert list(numbers.elements.rows) == [1, 6, -1]
+
+
+def test_custom_elements():
+    vegetables = Elementable(json_file=VEGETABLES_JSON, key_attr="name")
+    names = pd.Series(["carrot", "tuber", "carrot"])
+    colors = names.elements(vegetables).color
+    assert list(colors) == ["orange", "white", "orange"]
+
+    leaves = pd.Series([3, 0])
+    names = leaves.elements(vegetables, attr_name="n_leaves").name
+    assert list(names) == ["carrot", "tuber"]
+
+
+def test_not_unique():
+    periods = pd.Series([1, 2])
+    with pytest.raises(ElementableError, match="unique"):
+        periods.elements(attr_name="period").mass
+
+
+def test_invalid_attribute():
+    with pytest.raises(AttributeError):
+        pd.Series(["H"]).elements.parsnip
+
+
+class TestElementDtype:
+
+    @pytest.fixture
+    def atoms(self):
+        return pd.Series(["C", "H", "h", "O", None], dtype="element")
+
+    def test_codes(self, atoms):
+        from elementable.dataframe import ElementDtype
+
+        assert atoms.dtype == ElementDtype(Elements)
+        assert atoms.array.codes.dtype == np.uint8
+        assert atoms.nbytes == 5
+        assert list(atoms.array.rows) == [6, 1, 1, 8, -1]
+
+    def test_getitem(self, atoms):
+        assert atoms[1] is Elements.H
+        assert atoms[4] is pd.NA
+        assert list(atoms.isna()) == [False] * 4 + [True]
+
+    def test_gather(self, atoms):
+        masses = atoms.elements.mass
+        assert masses[0] == Elements.C.mass
+        assert np.isnan(masses[4])
+        np.testing.assert_allclose(
+            atoms.array.attribute("covalent_radius")[:2],
+            [0.76, 0.31],
+        )
+
+    def test_operations(self, atoms):
+        assert atoms.value_counts()[Elements.H] == 2
+        assert list(atoms == Elements.H) == [False, True, True, False, False]
+        combined = pd.concat([atoms, atoms], ignore_index=True)
+        assert combined[6] is Elements.H
+        taken = atoms.take([3, 0])
+        assert list(taken) == [Elements.O, Elements.C]
+
+    def test_sort(self, atoms):
+        ordered = atoms.sort_values()
+        assert list(ordered.index) == [1, 2, 0, 3, 4]
+        assert ordered.iloc[-1] is pd.NA
+        assert list(atoms.argsort())[:4] == [1, 2, 0, 3]
+
+    def test_groupby(self, atoms):
+        frame = pd.DataFrame({"el": atoms, "charge": [0.1, 0.2, 0.3, -0.4, 1.0]})
+        sizes = frame.groupby("el").size()
+        assert list(sizes.index) == [Elements.H, Elements.C, Elements.O]
+        assert list(sizes) == [2, 1, 1]
+        charges = frame.groupby("el", sort=False)["charge"].sum()
+        assert charges[Elements.H] == pytest.approx(0.5)
+
+    def test_from_elements_and_numbers(self):
+        from elementable.dataframe import ElementArray
+
+        by_element = pd.array([Elements.O, Elements.Fe], dtype="element")
+        by_number = ElementArray.from_values([8, 26])
+        assert list(by_element.rows) == list(by_number.rows) == [8, 26]
+
+    def test_invalid(self):
+        from elementable.exceptions import InvalidElementError
+
+        with pytest.raises(InvalidElementError):
+            pd.Series(["C", "Qq"], dtype="element")
+
+    def test_custom_elements(self):
+        from elementable.dataframe import ElementArray
+
+        vegetables = Elementable(json_file=VEGETABLES_JSON, key_attr="name")
+        array = ElementArray.from_values(["tuber", "carrot"], vegetables)
+        assert array[0] is vegetables.tuber
+        assert list(pd.Series(array).elements.color) == ["white", "orange"]
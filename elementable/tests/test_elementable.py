@@ -1,9 +1,11 @@
 
 import copy
+from typing import Optional
 
 import pytest
 from elementable import Elements, Elementable
-from elementable.exceptions import ElementableError
+from elementable.elementable import DenseMapping
+from elementable.exceptions import ElementableError, InvalidElementError
 
 from .base import BaseTestElementable
 from .datafiles import VEGETABLES_JSON
@@ -25,7 +27,8 @@ class TestStandardElementable(BaseTestElementable):
 
     def test_copy(self):
         copied = copy.deepcopy(Elements.X)
-        assert copied == Elements.X
+        assert copied.value_equals(Elements.X)
+        assert copied != Elements.X
         assert not copied is Elements.X
 
 
@@ -51,3 +54,265 @@ class TestCustomElementable:
             match="parsnip attribute not supported",
         ):
             element_class(parsnip=3)
+
+
+class TestSchemaElementable(BaseTestElementable):
+    element_class = Elementable(
+        schema=dict(
+            name=str,
+            symbol=str,
+            atomic_number=int,
+            mass=float,
+            period=int,
+            group=Optional[int],
+            covalent_radius=Optional[float],
+        )
+    )
+
+    def test_annotations(self):
+        annotations = self.element_class.element_class.__annotations__
+        assert annotations["covalent_radius"] == Optional[float]
+        assert annotations["mass"] is float
+
+    def test_int_converted_to_float(self):
+        vegetables = Elementable(
+            json_file=VEGETABLES_JSON,
+            key_attr="name",
+            schema=dict(
+                name=str,
+                color=str,
+                n_leaves=int,
+                weight=Optional[float],
+            ),
+        )
+        assert type(vegetables.carrot.weight) is float
+        assert vegetables.parsnip.weight is None
+
+    @pytest.mark.parametrize("schema, match", [
+        (dict(name=str, color=str, n_leaves=int), "not declared in schema"),
+        (dict(name=str, color=str, n_leaves=float, weight=str),
+         "Invalid values for weight"),
+        (dict(name=str, color=int, n_leaves=int, weight=float),
+         "Invalid values for color"),
+    ])
+    def test_invalid_schema(self, schema, match):
+        with pytest.raises(ElementableError, match=match):
+            Elementable(json_file=VEGETABLES_JSON, key_attr="name",
+                        schema=schema)
+
+    def test_missing_value(self):
+        data = [{"name": "a", "w": 1.0}, {"name": "b"}]
+        with pytest.raises(ElementableError, match="Invalid values for w"):
+            Elementable(data=data, key_attr="name", schema=dict(name=str, w=float))
+        elements = Elementable(
+            data=data, key_attr="name", schema=dict(name=str, w=Optional[float])
+        )
+        assert elements.b.w is None
+
+
+class TestLazyRegistry:
+
+    def test_built_on_access(self):
+        elements = Elementable()
+        assert "mass" not in vars(elements.registry)
+        hydrogen = elements.registry.mass[1.0078]
+        assert "mass" in vars(elements.registry)
+        assert elements.registry.mass is elements.registry.mass
+        assert hydrogen is elements.H
+
+    def test_built_on_query(self):
+        elements = Elementable()
+        assert elements(mass=1.0078) is elements.H
+        assert "mass" in vars(elements.registry)
+        assert "covalent_radius" not in vars(elements.registry)
+
+    def test_indexed(self):
+        elements = Elementable(indexed=["symbol", "atomic_number"])
+        built = set(vars(elements.registry)) & set(elements.registry._fields)
+        assert built == {"symbol", "atomic_number"}
+
+    def test_indexed_invalid(self):
+        with pytest.raises(ElementableError, match="Cannot index parsnip"):
+            Elementable(indexed=["parsnip"])
+
+    def test_read_only(self):
+        with pytest.raises(AttributeError, match="read-only"):
+            Elements.registry.mass = {}
+
+
+class TestDenseMapping:
+
+    @pytest.fixture
+    def mapping(self):
+        return DenseMapping({3: "c", 0: "a", 5: "f"})
+
+    def test_mapping(self, mapping):
+        assert len(mapping) == 3
+        assert list(mapping) == [0, 3, 5]
+        assert dict(mapping) == {0: "a", 3: "c", 5: "f"}
+        assert mapping == {0: "a", 3: "c", 5: "f"}
+        assert mapping.get(1) is None
+
+    @pytest.mark.parametrize("key, value", [
+        (3, "c"),
+        (3.0, "c"),
+        (False, "a"),
+    ])
+    def test_getitem(self, mapping, key, value):
+        assert mapping[key] == value
+        assert key in mapping
+
+    @pytest.mark.parametrize("key", [
+        -1, -3, 1, 6, 100, 3.5, float("nan"), float("inf"), "3", None, (3,),
+    ])
+    def test_missing(self, mapping, key):
+        with pytest.raises(KeyError):
+            mapping[key]
+        assert key not in mapping
+
+    def test_read_only(self, mapping):
+        with pytest.raises(TypeError):
+            mapping[1] = "b"
+
+    def test_numpy_keys(self, mapping):
+        np = pytest.importorskip("numpy")
+        assert mapping[np.int64(5)] == "f"
+        assert mapping[np.float32(5)] == "f"
+        assert mapping.values_by_key[np.uint8(3)] == "c"
+
+    def test_row_registries(self):
+        elements = Elementable(lazy=True)
+        assert elements.registry.atomic_number[8.0] is elements.O
+        assert elements(atomic_number=8.0) is elements.O
+        assert elements.registry.period[1] == (elements.H, elements.He)
+        assert list(elements.registry.period) == list(range(8))
+        assert elements.rows("atomic_number", [8, 8.0, -1, 200]) == [8, 8, -1, -1]
+        with pytest.raises(InvalidElementError):
+            elements(atomic_number=-1)
+
+
+class TestQuantizedElementable:
+
+    @pytest.fixture
+    def elements(self):
+        return Elementable(resolution=dict(mass=1e-4, covalent_radius=0.01))
+
+    def test_registry_keys(self, elements):
+        assert elements.registry.mass[10078] is elements.H
+        assert 1.0078 not in elements.registry.mass
+        assert elements.registry.covalent_radius[31] == (elements.H,)
+
+    @pytest.mark.parametrize("mass", [1.0078, 1.00783, 1.007849, 1.00776])
+    def test_query(self, elements, mass):
+        assert elements(mass=mass) is elements.H
+        assert elements.by_mass(mass) is elements.H
+        assert elements.get(mass=mass) is elements.H
+
+    def test_per_attribute_resolution(self, elements):
+        assert elements(covalent_radius=0.314) == (elements.H,)
+        with pytest.raises(InvalidElementError, match="mass=120001"):
+            elements(mass=12.0001)
+        with pytest.raises(InvalidElementError):
+            elements.by_mass(12.0001)
+        assert elements.rows("mass", [12, 12.00004, 11]) == [6, 6, -1]
+
+    def test_multiple(self, elements):
+        assert elements(mass=1.00783, covalent_radius=0.31) == (elements.H,)
+
+    def test_column_unchanged(self, elements):
+        assert elements.column("mass")[1] == elements.H.mass
+
+    @pytest.mark.parametrize("resolution, match", [
+        (dict(parsnip=1), "attribute not supported"),
+        (dict(symbol=1), "must be positive"),
+        (dict(mass=0), "must be positive"),
+    ])
+    def test_invalid(self, resolution, match):
+        with pytest.raises(ElementableError, match=match):
+            Elementable(resolution=resolution)
+
+
+class TestLazyElementable(BaseTestElementable):
+    element_class = Elementable(lazy=True)
+
+    def test_identity(self):
+        h = self.element_class.H
+        assert h is self.element_class[1]
+        assert h is self.element_class.registry.symbol["H"]
+        assert h is self.element_class(name="hydrogen")
+
+    def test_iteration(self):
+        elements = list(self.element_class)
+        assert len(elements) == self.element_class.n_elements
+        assert elements[8] is self.element_class.O
+        assert self.element_class[-1] is elements[-1]
+        assert self.element_class[1:3] == tuple(elements[1:3])
+
+    def test_tuple_methods(self):
+        elements = self.element_class
+        eager = Elementable()
+        assert elements.index(elements.H) == eager.index(eager.H) == 1
+        assert elements.index(elements.O, 2, 10) == 8
+        assert elements.count(elements.H) == eager.count(eager.H) == 1
+        assert elements.count(eager.H) == 0
+        assert elements.count("H") == 0
+        for value, args in [(eager.H, ()), (elements.O, (0, 5)), (1, ())]:
+            with pytest.raises(ValueError, match="not in tuple"):
+                elements.index(value, *args)
+
+    def test_equality(self):
+        elements = self.element_class
+        assert elements == elements
+        assert elements == tuple(elements)
+        assert elements != Elementable(lazy=True)
+        assert elements != tuple(range(elements.n_elements))
+        assert hash(elements) == hash(tuple(elements))
+
+    def test_multiple_query(self):
+        indium = self.element_class(period=5, group=13)
+        assert indium == (self.element_class.In,)
+
+
+class TestBuildMany:
+
+    def test_build_many(self):
+        elements, lazy, vegetables = Elementable.build_many([
+            {},
+            dict(lazy=True),
+            dict(json_file=VEGETABLES_JSON, key_attr="name"),
+        ])
+        assert elements.n_elements == lazy.n_elements == 118
+        assert elements.H.mass == lazy.H.mass
+        assert vegetables.carrot.color == "orange"
+
+    def test_shared_data(self, monkeypatch):
+        from elementable import elementable
+
+        loaded = []
+        load_json = elementable._load_json
+
+        def counting_load_json(json_file):
+            loaded.append(json_file)
+            return load_json(json_file)
+
+        monkeypatch.setattr(elementable, "_load_json", counting_load_json)
+        elements, lazy = Elementable.build_many([{}, dict(lazy=True)])
+        assert len(loaded) == 1
+        assert elements.H is not lazy.H
+        assert elements.H != lazy.H
+        assert elements.H.value_equals(lazy.H)
+
+    def test_data(self):
+        data = [{"name": "carrot", "color": "orange"}]
+        vegetables = Elementable(data=data, key_attr="name")
+        assert vegetables.carrot.color == "orange"
+        assert data == [{"name": "carrot", "color": "orange"}]
+
+
+class TestReservedKeys:
+
+    @pytest.mark.parametrize("lazy", [False, True])
+    def test_reserved_keys(self, lazy):
+        data = [{"name": "search"}, {"name": "carrot"}, {"name": "get"}]
+        with pytest.raises(ElementableError, match="Cannot use get, search as name"):
+            Elementable(data=data, key_attr="name", lazy=lazy)
@@ -0,0 +1,72 @@
+import pytest
+
+from elementable import Elements, Elementable
+from elementable.exceptions import ElementableError, InvalidElementError
+from elementable.guessing import ElementGuesser
+
+from .datafiles import VEGETABLES_JSON
+
+
+class TestElementGuesser:
+
+    @pytest.mark.parametrize("name, residue, symbol", [
+        ("CA", "ALA", "C"),
+        ("CA", None, "C"),
+        ("CA", "CA", "Ca"),
+        ("NA", "HEM", "N"),
+        ("NA", "NA+", "Na"),
+        ("NE2", "HIS", "N"),
+        ("HG", "SER", "H"),
+        ("HG", "HG", "Hg"),
+        ("1HB", "ALA", "H"),
+        ("HW1", "HOH", "H"),
+        ("OW", "HOH", "O"),
+        ("CL-", None, "Cl"),
+        ("CL", "CL", "Cl"),
+        ("Cl", None, "Cl"),
+        ("BR", None, "Br"),
+        ("FE", "HEM", "Fe"),
+        ("ZN", None, "Zn"),
+        ("MG2+", None, "Mg"),
+        ("K", "K", "K"),
+        ("c3", None, "C"),
+        (" OXT ", "GLY", "O"),
+        ("SE", "MSE", "Se"),
+        ("SD", "MET", "S"),
+        ("SE", None, "S"),
+    ])
+    def test_guess(self, name, residue, symbol):
+        assert Elements.guess(name, residue) is getattr(Elements, symbol)
+
+    @pytest.mark.parametrize("name", ["", "123", "QQ", "*", "-"])
+    def test_no_guess(self, name):
+        guesser = ElementGuesser()
+        assert guesser.guess(name) is None
+        assert guesser.guess(name, default="?") == "?"
+        with pytest.raises(InvalidElementError):
+            guesser(name)
+
+    def test_configure(self):
+        guesser = ElementGuesser(two_letter=(), aliases={"SOD": "Na"})
+        assert guesser("CL") is Elements.C
+        assert guesser("SOD", "SOD") is Elements.Na
+
+        guesser = ElementGuesser(residue_aliases={"lig": {"cx": "Cs"}})
+        assert guesser("CX", "LIG") is Elements.Cs
+        assert guesser("SE", "MSE") is Elements.S
+
+    def test_cache(self):
+        guesser = ElementGuesser()
+        assert guesser.guess_many(["CA", "CA", "HA"], ["ALA", "CA", "ALA"]) == [
+            Elements.C, Elements.Ca, Elements.H,
+        ]
+        assert set(guesser._cache) == {("CA", "ALA"), ("CA", "CA"), ("HA", "ALA")}
+        guesser.clear_cache()
+        assert not guesser._cache
+
+    def test_custom_elements(self):
+        vegetables = Elementable(json_file=VEGETABLES_JSON, key_attr="name")
+        with pytest.raises(ElementableError, match="symbol attribute not supported"):
+            vegetables.guess("CA")
+        guesser = ElementGuesser(vegetables, attr_name="name")
+        assert guesser("CARROT1").name == "carrot"
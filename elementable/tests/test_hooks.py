@@ -0,0 +1,72 @@
+import pytest
+
+from elementable import Elementable, Elements, tracing, set_tracer, get_tracer
+from elementable.exceptions import InvalidElementError
+
+
+def test_build_events():
+    events = []
+    with tracing(events.append):
+        elements = Elementable(indexed=["symbol"])
+    stages = [event.event for event in events]
+    assert stages == ["load", "types", "elements", "registry", "container"]
+    assert events[2].size == elements.n_elements
+    assert events[3].attribute == "symbol"
+    assert all(event.duration >= 0 for event in events)
+
+
+def test_query_events():
+    events = []
+    with tracing(events.append):
+        Elements(symbol="h")
+        Elements(period=5, group=13)
+        with pytest.raises(InvalidElementError):
+            Elements(atomic_number=-1)
+        Elements(mass=1.007825032, atomic_number=1)
+        Elements("oxygen", "O")
+    events = [event for event in events if event.event != "registry"]
+
+    lookup = events[0]
+    assert lookup.event == "lookup"
+    assert lookup.attribute == "symbol"
+    assert lookup.key == "H"
+    assert lookup.size == 1
+
+    assert [event.event for event in events[1:4]] == [
+        "lookup", "lookup", "query"
+    ]
+    assert events[3].key == (("group", 13), ("period", 5))
+    assert events[3].attribute == "group,period"
+    assert events[3].size == 1
+    assert events[4].size == 0
+
+    queries = [event for event in events if event.event == "query"]
+    assert queries[1].key == (("atomic_number", 1), ("mass", 1.0078))
+    assert queries[1].size == 1
+    assert queries[2].key == (("name", "oxygen"), ("symbol", "O"))
+    assert queries[2].attribute == "name,symbol"
+
+
+def test_set_tracer():
+    events = []
+    set_tracer(events.append)
+    try:
+        assert get_tracer() is not None
+        Elements(symbol="O")
+    finally:
+        set_tracer(None)
+    Elements(symbol="O")
+    assert get_tracer() is None
+    assert [event.event for event in events][-1:] == ["lookup"]
+    assert len([event for event in events if event.event == "lookup"]) == 1
+
+
+def test_tracer_with_stats():
+    elements = Elementable(indexed=["symbol"])
+    elements.enable_stats()
+    events = []
+    with tracing(events.append):
+        elements(symbol="O")
+    elements(symbol="O")
+    assert len(events) == 1
+    assert elements.stats()["attributes"]["symbol"]["lookups"] == 2
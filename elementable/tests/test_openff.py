@@ -37,3 +37,22 @@ class TestOpenFFElementable(BaseTestElementable):
         assert len(els) == 5
         atomic_numbers = [el.atomic_number for el in els]
         assert atomic_numbers == [24, 46, 50, 51, 53]
+
+
+class TestDeferredOpenFFElementable(TestOpenFFElementable):
+
+    element_class = Elementable(
+        units=dict(
+            mass=unit.amu,
+            covalent_radius=unit.angstrom
+        ),
+        defer_units=True,
+    )
+
+    def test_stored_magnitudes(self):
+        h = self.element_class.H
+        assert tuple.__getitem__(h, 3) == 1.00782503223
+        assert h._asdict()["mass"] == 1.00782503223
+        assert h.mass.units == unit.amu
+        assert h.mass is self.element_class.H.mass
+        assert self.element_class.X.covalent_radius is None
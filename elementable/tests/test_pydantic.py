@@ -40,9 +40,14 @@ class TestPydanticElementable(BaseTestElementable):
 
     def test_copy(self):
         copied = self.element_class.X.copy(deep=True)
-        assert copied == self.element_class.X
+        assert copied.value_equals(self.element_class.X)
+        assert copied != self.element_class.X
         assert not copied is self.element_class.X
 
+    def test_immutable(self):
+        with pytest.raises(AttributeError, match="immutable"):
+            self.element_class.H.mass = 3
+
     def test_creation_get_existing(self):
         new = self.element_class.element_class(symbol="H")
         assert new is self.element_class.H
@@ -63,3 +68,21 @@ class TestUnitPydanticElementable(BaseTestElementable):
             covalent_radius=unit.angstrom
         ),
     )
+
+
+@pytest.mark.skipif(not has_openff, reason="requires openff.units")
+class TestDeferredUnitPydanticElementable(TestUnitPydanticElementable):
+
+    element_class = Elementable(
+        element_cls=TestUnitPydanticElementable.Model,
+        units=dict(
+            mass=unit.amu,
+            covalent_radius=unit.angstrom
+        ),
+        defer_units=True,
+    )
+
+    def test_json(self):
+        h = self.element_class.H
+        assert h.mass.m_as(unit.amu) == 1.00782503223
+        assert h.dict()["mass"] == 1.00782503223
@@ -0,0 +1,93 @@
+import pytest
+
+from elementable import Elements
+from elementable.exceptions import ElementableError
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def system():
+    # two waters and a methane
+    rng = np.random.default_rng(7)
+    rows = np.array([8, 1, 1, 8, 1, 1, 6, 1, 1, 1, 1])
+    groups = np.array([0, 0, 0, 1, 1, 1, 2, 2, 2, 2, 2])
+    frames = rng.normal(size=(4, len(rows), 3))
+    return rows, groups, frames
+
+
+def reference(rows, groups, coordinates):
+    masses = np.array([Elements[row].mass for row in rows])
+    totals, centers, radii = [], [], []
+    for group in range(groups.max() + 1):
+        mask = groups == group
+        m, x = masses[mask], coordinates[mask]
+        center = (m[:, None] * x).sum(axis=0) / m.sum()
+        totals.append(m.sum())
+        centers.append(center)
+        radii.append(np.sqrt((m * ((x - center) ** 2).sum(axis=1)).sum() / m.sum()))
+    return np.array(totals), np.array(centers), np.array(radii)
+
+
+class TestReductions:
+
+    def test_total_mass(self, system):
+        rows, groups, _ = system
+        totals, _, _ = reference(rows, groups, np.zeros((len(rows), 3)))
+        np.testing.assert_allclose(Elements.total_mass(rows, groups), totals)
+        assert Elements.total_mass(rows) == pytest.approx(totals.sum())
+
+    def test_frames(self, system):
+        rows, groups, frames = system
+        centers = Elements.center_of_mass(rows, frames, groups)
+        radii = Elements.radius_of_gyration(rows, frames, groups)
+        assert centers.shape == (4, 3, 3)
+        assert radii.shape == (4, 3)
+        for frame, center, radius in zip(frames, centers, radii):
+            _, expected_center, expected_radius = reference(rows, groups, frame)
+            np.testing.assert_allclose(center, expected_center)
+            np.testing.assert_allclose(radius, expected_radius)
+
+    def test_single_frame_single_group(self, system):
+        rows, _, frames = system
+        groups = np.zeros(len(rows), dtype=int)
+        _, expected_center, expected_radius = reference(rows, groups, frames[0])
+        center = Elements.center_of_mass(rows, frames[0])
+        radius = Elements.radius_of_gyration(rows, frames[0])
+        assert center.shape == (3,)
+        assert radius.shape == ()
+        np.testing.assert_allclose(center, expected_center[0])
+        np.testing.assert_allclose(radius, expected_radius[0])
+
+    def test_iterator(self, system):
+        rows, groups, frames = system
+        from_iterator = Elements.radius_of_gyration(rows, iter(frames), groups)
+        np.testing.assert_allclose(
+            from_iterator,
+            Elements.radius_of_gyration(rows, frames, groups),
+        )
+
+    def test_no_frames(self, system):
+        rows, groups, frames = system
+        n_groups = groups.max() + 1
+        for empty in [iter([]), frames[:0]]:
+            centers = Elements.center_of_mass(rows, empty, groups)
+            assert centers.shape == (0, n_groups, 3)
+        radii = Elements.radius_of_gyration(rows, iter([]))
+        assert radii.shape == (0,)
+
+    def test_empty_group(self, system):
+        rows, groups, frames = system
+        centers = Elements.center_of_mass(rows, frames[0], groups, n_groups=4)
+        assert np.isnan(centers[3]).all()
+        assert not np.isnan(centers[:3]).any()
+
+    @pytest.mark.parametrize("rows, frames, groups, match", [
+        ([1, 500], np.zeros((2, 3)), None, "rows of the elements"),
+        ([1, 1], np.zeros((3, 3)), None, "frames must have shape"),
+        ([1, 1], np.zeros((2, 3)), [0], "groups must have shape"),
+        ([1, 1], np.zeros((2, 3)), [0, -1], "non-negative"),
+    ])
+    def test_invalid(self, rows, frames, groups, match):
+        with pytest.raises(ElementableError, match=match):
+            Elements.center_of_mass(rows, frames, groups)
@@ -0,0 +1,160 @@
+import pytest
+
+from elementable import Elements, Elementable
+from elementable import elementable
+from elementable.exceptions import ElementableError
+from elementable.search import StringIndex, levenshtein
+
+from .datafiles import VEGETABLES_JSON
+
+
+class TestStringIndex:
+
+    @pytest.fixture
+    def index(self):
+        return StringIndex(["Carbon", "calcium", None, "Chlorine", "iron", "cal"])
+
+    def test_prefix(self, index):
+        assert index.prefix("ca") == {0, 1, 5}
+        assert index.prefix("CAL") == {1, 5}
+        assert index.prefix("calcium") == {1}
+        assert index.prefix("x") == set()
+        assert index.prefix("") == {0, 1, 3, 4, 5}
+
+    @pytest.mark.parametrize("substring, rows", [
+        ("r", {0, 3, 4}),
+        ("on", {0, 4}),
+        ("CIU", {1}),
+        ("lori", {3}),
+        ("chlorine", {3}),
+        ("cium", {1}),
+        ("rbn", set()),
+        ("calciumx", set()),
+        ("", {0, 1, 3, 4, 5}),
+    ])
+    def test_contains(self, index, substring, rows):
+        assert index.contains(substring) == rows
+
+    def test_non_string(self):
+        with pytest.raises(ElementableError, match="non-string"):
+            StringIndex(["a", 1])
+
+
+class TestSearch:
+
+    def test_prefix(self):
+        assert Elements.search(prefix="ch") == (Elements.Cl, Elements.Cr)
+        assert Elements.search(prefix="ar") == (Elements.Ar, Elements.As)
+        assert Elements.search(prefix="he", attr_name="name") == (Elements.He,)
+
+    def test_contains(self):
+        assert Elements.search(contains="xe") == (Elements.Xe,)
+        found = Elements.search(contains="ium", attr_name="name")
+        assert Elements.He in found and Elements.Na in found
+        assert Elements.C not in found
+
+    def test_prefix_and_contains(self):
+        found = Elements.search(prefix="s", contains="ur", attr_name="name")
+        assert found == (Elements.S,)
+
+    def test_custom_table(self):
+        vegetables = Elementable(json_file=VEGETABLES_JSON, key_attr="name")
+        assert [v.name for v in vegetables.search(prefix="CAR")] == ["carrot"]
+
+    def test_invalid(self):
+        with pytest.raises(ElementableError, match="Either prefix or contains"):
+            Elements.search()
+        with pytest.raises(ElementableError, match="not supported"):
+            Elements.search(prefix="a", attr_name="parsnip")
+        with pytest.raises(ElementableError, match="non-string"):
+            Elements.search(prefix="1", attr_name="mass")
+
+
+class TestLevenshtein:
+
+    @pytest.mark.parametrize("a, b, distance", [
+        ("", "", 0),
+        ("abc", "", 3),
+        ("kitten", "sitting", 3),
+        ("flourine", "fluorine", 2),
+        ("aluminum", "aluminium", 1),
+    ])
+    def test_levenshtein(self, a, b, distance):
+        assert levenshtein(a, b) == distance
+        assert levenshtein(b, a) == distance
+
+    @pytest.mark.parametrize("a, b, max_distance, distance", [
+        ("kitten", "sitting", 3, 3),
+        ("kitten", "sitting", 2, 3),
+        ("kitten", "sitting", 0, 1),
+        ("abcdef", "a", 2, 3),
+        ("flourine", "fluorine", 2, 2),
+        ("", "", 0, 0),
+    ])
+    def test_bounded(self, a, b, max_distance, distance):
+        assert levenshtein(a, b, max_distance) == distance
+        assert levenshtein(b, a, max_distance) == distance
+
+
+class TestFuzzyIndex:
+
+    def test_matches_brute_force(self):
+        words = [
+            "carbon", "carton", "cartoon", "car", "cat", "bat", None,
+            "Boat", "coat", "carbon", "cobalt", "", "carbonate", "oat",
+        ]
+        index = StringIndex(words)
+        for query in ["carbon", "cart", "boot", "x", "", "CARBONATES"]:
+            for max_distance in range(4):
+                expected = sorted(
+                    (levenshtein(query.casefold(), word.casefold()), row)
+                    for row, word in enumerate(words)
+                    if word is not None
+                    and levenshtein(query.casefold(), word.casefold())
+                    <= max_distance
+                )
+                assert index.fuzzy(query, max_distance) == expected
+
+    def test_empty(self):
+        assert StringIndex([]).fuzzy("a") == []
+
+
+class TestFuzzy:
+
+    @pytest.mark.parametrize("query, symbol", [
+        ("flourine", "F"),
+        ("sulphur", "S"),
+        ("aluminum", "Al"),
+        ("cesium", "Cs"),
+        ("Hydrogen", "H"),
+    ])
+    def test_name(self, query, symbol):
+        assert Elements.fuzzy(name=query)[0] is getattr(Elements, symbol)
+
+    def test_ranked(self):
+        found = Elements.fuzzy(symbol="C", max_distance=1)
+        assert found[0] is Elements.C
+        assert Elements.Ca in found and Elements.H in found
+        assert Elements.fuzzy(symbol="C", max_distance=1, limit=2) == found[:2]
+
+    def test_no_match(self):
+        assert Elements.fuzzy(name="parsnip") == ()
+
+    def test_invalid(self):
+        with pytest.raises(ElementableError, match="exactly one attribute"):
+            Elements.fuzzy(name="carbon", symbol="C")
+        with pytest.raises(ElementableError, match="not supported"):
+            Elements.fuzzy(parsnip="carbon")
+
+    def test_indexed(self, monkeypatch):
+        built = []
+
+        def counting_string_index(values):
+            built.append(values)
+            return StringIndex(values)
+
+        monkeypatch.setattr(elementable, "StringIndex", counting_string_index)
+        elements = Elementable(indexed=["name", "mass"])
+        assert len(built) == 1
+        assert elements.fuzzy(name="sulphur")[0] is elements.S
+        assert len(built) == 1
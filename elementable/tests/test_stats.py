@@ -0,0 +1,74 @@
+import pytest
+
+from elementable import Elementable
+from elementable.exceptions import InvalidElementError
+
+
+@pytest.fixture
+def elements():
+    return Elementable()
+
+
+def test_disabled_by_default(elements):
+    elements(symbol="H")
+    stats = elements.stats()
+    assert not stats["enabled"]
+    assert stats["attributes"] == {}
+    assert stats["multiple"]["lookups"] == 0
+
+
+def test_lookup_counts(elements):
+    elements.enable_stats()
+    elements(symbol="H")
+    elements(symbol="he")
+    elements.element_class(atomic_number=3)
+    with pytest.raises(InvalidElementError):
+        elements(symbol="Qq")
+
+    stats = elements.stats()
+    assert stats["enabled"]
+    symbol = stats["attributes"]["symbol"]
+    assert symbol["lookups"] == 3
+    assert symbol["hits"] == 2
+    assert symbol["misses"] == 1
+    assert symbol["total_time"] > 0
+    assert symbol["p50"] <= symbol["p99"]
+    assert stats["attributes"]["atomic_number"]["hits"] == 1
+
+
+def test_multiple(elements):
+    elements.enable_stats()
+    elements(period=5, group=13)
+    elements(period=111, group=1)
+
+    stats = elements.stats()
+    assert stats["multiple"]["lookups"] == 2
+    assert stats["multiple"]["hits"] == 1
+    assert stats["multiple"]["misses"] == 1
+    assert stats["attributes"]["period"]["misses"] == 1
+
+
+def test_reset_and_disable(elements):
+    elements.enable_stats()
+    elements(symbol="H")
+    elements.reset_stats()
+    assert elements.stats()["attributes"] == {}
+
+    elements.enable_stats(False)
+    elements(symbol="H")
+    assert elements.stats()["attributes"] == {}
+    assert not elements.stats()["enabled"]
+
+
+def test_accessor_stats(elements):
+    elements.by_symbol("H")
+    elements.enable_stats()
+    elements.by_symbol("H")
+    elements["He"]
+    with pytest.raises(InvalidElementError):
+        elements.by_symbol("Qq")
+    symbol = elements.stats()["attributes"]["symbol"]
+    assert (symbol["hits"], symbol["misses"]) == (2, 1)
+    elements.enable_stats(False)
+    elements.by_symbol("H")
+    assert elements.stats()["attributes"]["symbol"]["lookups"] == 3
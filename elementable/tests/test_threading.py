@@ -0,0 +1,52 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+
+import pytest
+
+from elementable import Elementable, CompactElement
+
+N_THREADS = 16
+
+
+def run_concurrently(func):
+    barrier = Barrier(N_THREADS)
+
+    def wait_and_run():
+        barrier.wait()
+        return func()
+
+    with ThreadPoolExecutor(max_workers=N_THREADS) as executor:
+        futures = [executor.submit(wait_and_run) for _ in range(N_THREADS)]
+        return [future.result() for future in futures]
+
+
+@pytest.mark.parametrize("kwargs", [
+    {},
+    {"lazy": True},
+    {"lazy": True, "element_cls": CompactElement},
+])
+class TestConcurrentFirstUse:
+
+    def test_registry_built_once(self, kwargs):
+        elements = Elementable(**kwargs)
+        registries = run_concurrently(lambda: elements.registry.mass)
+        assert all(registry is registries[0] for registry in registries)
+
+    def test_same_element(self, kwargs):
+        elements = Elementable(**kwargs)
+
+        def lookup():
+            return [
+                elements(atomic_number=z)
+                for z in range(elements.n_elements)
+            ]
+
+        results = run_concurrently(lookup)
+        for result in results:
+            assert all(x is y for x, y in zip(result, results[0]))
+
+    def test_misses_do_not_mutate(self, kwargs):
+        elements = Elementable(**kwargs)
+        run_concurrently(lambda: elements(period=111, group=1))
+        assert 111 not in elements.registry.period
+